@@ -0,0 +1,27 @@
+"""Atomic JSON writes shared by the app, mixer, wizard and updater.
+
+Every JSON file the app keeps (config, state, caches) goes through
+write_json(), so a reader never sees a half-written file and a crash
+mid-write leaves the previous version in place.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def write_json(path: Path, obj, indent: int | None = None):
+    """Write JSON via a temp file + rename so readers never see it torn.
+
+    Compact unless indent is given. No fsync: the rename already
+    protects against our own crashes, and vm_state.json is rewritten on
+    every slider step, where a flush to disk each time would stall the
+    UI.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        if indent is None:
+            json.dump(obj, f, separators=(",", ":"))
+        else:
+            json.dump(obj, f, indent=indent)
+    os.replace(tmp, path)
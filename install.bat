@@ -30,7 +30,7 @@ echo.
 set PYTHON_URL=https://www.python.org/ftp/python/3.13.2/python-3.13.2-amd64.exe
 set INSTALLER=%~dp0_python_installer.exe
 
-powershell -Command "Write-Host '  Downloading Python 3.13...' ; [Net.ServicePointManager]::SecurityProtocol = [Net.SecurityProtocolType]::Tls12 ; Invoke-WebRequest -Uri '%PYTHON_URL%' -OutFile '%INSTALLER%' -UseBasicParsing"
+powershell -NoProfile -NonInteractive -Command "Write-Host '  Downloading Python 3.13...' ; [Net.ServicePointManager]::SecurityProtocol = [Net.SecurityProtocolType]::Tls12 ; Invoke-WebRequest -Uri '%PYTHON_URL%' -OutFile '%INSTALLER%' -UseBasicParsing"
 
 if not exist "%INSTALLER%" (
     echo.
@@ -0,0 +1,34 @@
+# VR Audio Switcher - "Listen to this device" registry setup.
+#
+# Fallback used by setup_wizard.py when Python can't be launched elevated.
+# The two binary values are passed in as hex from setup_wizard.py's
+# LISTEN_BYTES_1/LISTEN_BYTES_2, so both routes write the same bytes.
+# Must be run as administrator:
+#   powershell -File listen_setup.ps1 -b2Guid "{...}" -targetId "{0.0.0.00000000}.{...}" -bytes1 "0b00..." -bytes2 "0b00..."
+
+param(
+    [Parameter(Mandatory = $true)][string]$b2Guid,
+    [Parameter(Mandatory = $true)][string]$targetId,
+    [Parameter(Mandatory = $true)][string]$bytes1,
+    [Parameter(Mandatory = $true)][string]$bytes2
+)
+
+$ErrorActionPreference = "Stop"
+$propGuid = "{24dbb0fc-9311-4b3d-9cf0-18ff155639d4}"
+$keyPath = "HKLM:\SOFTWARE\Microsoft\Windows\CurrentVersion\MMDevices\Audio\Capture\$b2Guid\Properties"
+
+function ConvertFrom-Hex([string]$hex) {
+    [byte[]]($hex -split '(..)' -ne '' | ForEach-Object { [Convert]::ToByte($_, 16) })
+}
+
+if (-not (Test-Path $keyPath)) {
+    Write-Error "Registry path not found: $keyPath"
+    exit 1
+}
+
+Set-ItemProperty -Path $keyPath -Name "$propGuid,0" -Value $targetId -Type String
+Set-ItemProperty -Path $keyPath -Name "$propGuid,1" -Value (ConvertFrom-Hex $bytes1) -Type Binary
+Set-ItemProperty -Path $keyPath -Name "$propGuid,2" -Value (ConvertFrom-Hex $bytes2) -Type Binary
+
+Write-Host "Listen to device configured successfully"
+exit 0
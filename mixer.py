@@ -10,6 +10,8 @@ import tkinter as tk
 from tkinter import ttk, simpledialog
 from pathlib import Path
 
+from atomic_json import write_json
+
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PRESETS_PATH = SCRIPT_DIR / "presets.json"
 VM_STATE_PATH = SCRIPT_DIR / "vm_state.json"
@@ -45,6 +47,20 @@ MODE_LABELS = {
     "DESKTOP": "Desktop",
     "VR": "Public", "SILENT_VR": "Private", None: "Any",
 }
+# Left-to-right order of the mode buttons
+MODE_ORDER = ("DESKTOP", "SILENT_VR", "VR")
+
+# (key, label, description) for each slider row
+VOLUME_SLIDERS = (
+    ("others", "Music for Others", "What friends hear (Public mode only)"),
+    ("me",     "Music for Me",     "What you hear in your VR headset"),
+    ("voice",  "My Voice",         "Your voice volume to others in VRChat"),
+)
+EQ_SLIDERS = (
+    ("bass",   "Bass",   "Low frequencies"),
+    ("mid",    "Mid",    "Mid frequencies"),
+    ("treble", "Treble", "High frequencies"),
+)
 
 DEFAULT_PRESETS = {
     "Default": {
@@ -118,8 +134,7 @@ def load_presets():
 
 
 def save_presets(presets):
-    with open(PRESETS_PATH, "w") as f:
-        json.dump(presets, f, indent=2)
+    write_json(PRESETS_PATH, presets, indent=2)
 
 
 # ---------------------------------------------------------------------------
@@ -133,6 +148,7 @@ class MixerApp:
         self.vm = app.vm
         self.presets = load_presets()
         self._closing = False
+        self._shown_state = None  # (mode, vr_active) last drawn
 
         self.root = tk.Tk()
         self.root.title("VR Audio Switcher")
@@ -227,7 +243,11 @@ class MixerApp:
     def _update_mode_display(self):
         """Refresh mode buttons, VR status, and title bar."""
         current = self.app.get_mode_name()
-        vr_active = self.app.detector.is_vr_running()
+        vr_active = self.app.detector.is_vr_running(cached=True)
+        # Called after every apply; only touch the widgets on a change
+        if (current, vr_active) == self._shown_state:
+            return
+        self._shown_state = (current, vr_active)
 
         # Highlight active mode button
         for mode_name, btn in self._mode_btns.items():
@@ -269,12 +289,8 @@ class MixerApp:
         mode_frame.pack(fill="x", pady=(0, 8))
 
         self._mode_btns = {}
-        modes = [
-            ("DESKTOP",   "Desktop",  "#4caf50"),
-            ("SILENT_VR", "Private",  "#fdd835"),
-            ("VR",        "Public",   "#f44336"),
-        ]
-        for mode_name, label, color in modes:
+        for mode_name in MODE_ORDER:
+            label, color = MODE_LABELS[mode_name], MODE_COLORS[mode_name]
             btn = tk.Button(
                 mode_frame, text=label, bg="#2a2a2a", fg=color,
                 activebackground=color, activeforeground="#000",
@@ -294,20 +310,12 @@ class MixerApp:
         # --- Volume sliders ---
         self._sec(main, "Volume")
         self._vars, self._lbls = {}, {}
-        for key, label, desc in [
-            ("others", "Music for Others", "What friends hear (Public mode only)"),
-            ("me",     "Music for Me",     "What you hear in your VR headset"),
-            ("voice",  "My Voice",         "Your voice volume to others in VRChat"),
-        ]:
+        for key, label, desc in VOLUME_SLIDERS:
             self._make_slider(main, key, label, desc, self.accent)
 
         # --- EQ sliders ---
         self._sec(main, "Music EQ")
-        for key, label, desc in [
-            ("bass",   "Bass",   "Low frequencies"),
-            ("mid",    "Mid",    "Mid frequencies"),
-            ("treble", "Treble", "High frequencies"),
-        ]:
+        for key, label, desc in EQ_SLIDERS:
             self._make_slider(main, key, label, desc, self.accent2)
 
         # --- Presets ---
@@ -464,8 +472,7 @@ class MixerApp:
                 pass
             fresh["exclude_processes"] = [lb.get(i) for i in range(lb.size())]
             try:
-                with open(CONFIG_PATH, "w") as f:
-                    json.dump(fresh, f, indent=2)
+                write_json(CONFIG_PATH, fresh, indent=2)
             except Exception:
                 pass
             save_btn.config(text="Saved!", bg="#66bb6a")
@@ -486,8 +493,12 @@ class MixerApp:
         update_frame = ttk.Frame(frame, style="D.TFrame")
         update_frame.pack(fill="x")
 
+        pending = getattr(self.app, "pending_update", None)
         self._update_status = ttk.Label(
-            update_frame, text="Updates are checked automatically on boot.",
+            update_frame,
+            text=(f"Update v{pending} available \u2014 click Check Now."
+                  if pending else
+                  "Updates are checked automatically on boot."),
             style="Desc.TLabel")
         self._update_status.pack(side="left")
 
@@ -673,8 +684,7 @@ class MixerApp:
 
         # Persist so settings survive VoiceMeeter restarts
         try:
-            with open(VM_STATE_PATH, "w") as f:
-                json.dump(params, f)
+            write_json(VM_STATE_PATH, params)
         except Exception:
             pass
 
@@ -6,8 +6,10 @@ Windows audio configuration, and shortcut creation.
 Run once:  python setup_wizard.py
 """
 
+import collections
 import ctypes
-import csv
+import ctypes.wintypes as wintypes
+import functools
 import json
 import logging
 import logging.handlers
@@ -26,6 +28,7 @@ CONFIG_PATH = SCRIPT_DIR / "config.json"
 VM_DEVICES_PATH = SCRIPT_DIR / "vm_devices.json"
 SVCL_PATH = SCRIPT_DIR / "svcl.exe"
 SVCL_URL = "https://www.nirsoft.net/utils/svcl-x64.zip"
+SVCL_CACHE_PATH = SCRIPT_DIR / "_svcl_cache.json"
 WIZARD_LOG_PATH = SCRIPT_DIR / "wizard.log"
 VM_DOWNLOAD_URL = ("https://download.vb-audio.com/Download_CABLE/"
                    "VoicemeeterSetup_v2122.zip")
@@ -33,59 +36,93 @@ RESUME_SHORTCUT = (Path(os.environ.get("APPDATA", ""))
                    / "Microsoft" / "Windows" / "Start Menu" / "Programs"
                    / "Startup" / "VR Audio Switcher Setup (resume).lnk")
 
-from vm_path import find_dll, find_exe, is_vm_process
+from atomic_json import write_json
+from vm_path import clear_cache as clear_vm_path_cache
+from vm_path import find_dll, find_exe, is_vm_process, kill_vm_processes
 
 REQUIRED_PACKAGES = ["psutil"]
 
-# Registry property keys for "Listen to this device"
+# How long a svcl device query stays valid before we re-run svcl.exe
+SVCL_CACHE_TTL = 10  # seconds
+# Repeated Refresh clicks within this window reuse the last query
+SVCL_REFRESH_DEBOUNCE = 3  # seconds
+# On-disk svcl results are reused across wizard runs for this long
+SVCL_DISK_CACHE_TTL = 30  # seconds
+
+# Fire-and-forget children: detached from our console (if any)
+_POPEN_FLAGS = getattr(subprocess, "DETACHED_PROCESS", 0)
+
+# Registry property keys for "Listen to this device" (listen_setup.ps1
+# gets the byte values as parameters; there is no second copy)
 LISTEN_PROP_GUID = "{24dbb0fc-9311-4b3d-9cf0-18ff155639d4}"
-LISTEN_BYTES_1 = "0x0B,0x00,0x00,0x00,0x01,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00"
-LISTEN_BYTES_2 = "0x0B,0x00,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00"
+LISTEN_BYTES_1 = bytes.fromhex("0B000000 01000000 FFFF0000")
+LISTEN_BYTES_2 = bytes.fromhex("0B000000 01000000 00000000")
+# Elevated fallback when Python can't be relaunched as admin
+LISTEN_PS_PATH = SCRIPT_DIR / "listen_setup.ps1"
 
 
 # ---------------------------------------------------------------------------
 # VoiceMeeter device enumeration
 # ---------------------------------------------------------------------------
+_vm_dll = None
+
+
+def _get_vm_dll():
+    """Load the VoiceMeeter Remote DLL once and declare its prototypes."""
+    global _vm_dll
+    if _vm_dll is not None:
+        return _vm_dll
+    dll_path = find_dll()
+    if not dll_path:
+        raise RuntimeError("VoiceMeeter DLL not found")
+    dll = ctypes.WinDLL(str(dll_path))
+    c_long = ctypes.c_long
+    desc_args = [c_long, ctypes.POINTER(c_long),
+                 ctypes.c_char_p, ctypes.c_char_p]
+    for fn in (dll.VBVMR_Login, dll.VBVMR_Logout,
+               dll.VBVMR_Input_GetDeviceNumber,
+               dll.VBVMR_Output_GetDeviceNumber):
+        fn.argtypes = []
+        fn.restype = c_long
+    dll.VBVMR_GetVoicemeeterType.argtypes = [ctypes.POINTER(c_long)]
+    dll.VBVMR_GetVoicemeeterType.restype = c_long
+    for fn in (dll.VBVMR_Input_GetDeviceDescA,
+               dll.VBVMR_Output_GetDeviceDescA):
+        fn.argtypes = desc_args
+        fn.restype = c_long
+    _vm_dll = dll
+    return dll
+
+
 class VMDeviceEnumerator:
     """Connect to VoiceMeeter and enumerate hardware devices."""
 
     TYPE_MAP = {1: "mme", 3: "wdm", 5: "ks"}
 
     def __init__(self):
-        dll_path = find_dll()
-        if not dll_path:
-            raise RuntimeError("VoiceMeeter DLL not found")
-        self._dll = ctypes.WinDLL(str(dll_path))
+        self._dll = _get_vm_dll()
         ret = self._dll.VBVMR_Login()
         if ret not in (0, 1):
             raise RuntimeError(f"VoiceMeeter login failed (code {ret})")
         time.sleep(0.2)
 
     def input_devices(self) -> list[dict]:
-        n = self._dll.VBVMR_Input_GetDeviceNumber()
-        devs = []
-        for i in range(n):
-            dt = ctypes.c_long()
-            name = ctypes.create_string_buffer(256)
-            hwid = ctypes.create_string_buffer(256)
-            if self._dll.VBVMR_Input_GetDeviceDescA(
-                    ctypes.c_long(i), ctypes.byref(dt), name, hwid) == 0:
-                devs.append({
-                    "index": i,
-                    "type": self.TYPE_MAP.get(dt.value, "?"),
-                    "name": name.value.decode("utf-8", errors="replace"),
-                })
-        return devs
+        return self._devices(self._dll.VBVMR_Input_GetDeviceNumber,
+                             self._dll.VBVMR_Input_GetDeviceDescA)
 
     def output_devices(self) -> list[dict]:
-        n = self._dll.VBVMR_Output_GetDeviceNumber()
+        return self._devices(self._dll.VBVMR_Output_GetDeviceNumber,
+                             self._dll.VBVMR_Output_GetDeviceDescA)
+
+    def _devices(self, count_fn, desc_fn) -> list[dict]:
+        # One set of buffers for the whole loop; the DLL overwrites them
+        dt = ctypes.c_long()
+        name = ctypes.create_string_buffer(256)
+        hwid = ctypes.create_string_buffer(256)
         devs = []
-        for i in range(n):
-            dt = ctypes.c_long()
-            name = ctypes.create_string_buffer(256)
-            hwid = ctypes.create_string_buffer(256)
-            if self._dll.VBVMR_Output_GetDeviceDescA(
-                    ctypes.c_long(i), ctypes.byref(dt), name, hwid) == 0:
+        for i in range(count_fn()):
+            name[0] = b"\0"
+            if desc_fn(i, ctypes.byref(dt), name, hwid) == 0:
                 devs.append({
                     "index": i,
                     "type": self.TYPE_MAP.get(dt.value, "?"),
@@ -107,45 +144,75 @@ def query_svcl_devices() -> list[dict]:
     """Run svcl.exe and return parsed device list."""
     if not SVCL_PATH.exists():
         return []
-    tmp = SCRIPT_DIR / "_setup_query.csv"
+    import csv
+    import io
     try:
-        subprocess.run(
-            [str(SVCL_PATH), "/scomma", str(tmp),
+        # An empty /scomma filename makes svcl write the CSV to stdout
+        proc = subprocess.run(
+            [str(SVCL_PATH), "/scomma", "",
              "/Columns", "Name,Command-Line Friendly ID,Item ID,"
                          "Direction,Type,Device State,Device Name"],
             capture_output=True, timeout=10,
             creationflags=subprocess.CREATE_NO_WINDOW,
         )
+        text = proc.stdout.decode("utf-8-sig", errors="replace")
         devices = []
-        with open(tmp, newline="", encoding="utf-8-sig",
-                  errors="replace") as f:
-            for row in csv.DictReader(f):
-                devices.append({
-                    "name": row.get("Name", "").strip(),
-                    "friendly_id": row.get("Command-Line Friendly ID",
-                                           "").strip(),
-                    "item_id": row.get("Item ID", "").strip(),
-                    "direction": row.get("Direction", "").strip(),
-                    "type": row.get("Type", "").strip(),
-                    "state": row.get("Device State", "").strip(),
-                    "device_name": row.get("Device Name", "").strip(),
-                })
+        for row in csv.DictReader(io.StringIO(text)):
+            name = row.get("Name", "").strip()
+            devices.append({
+                "name": name,
+                "name_lower": name.lower(),
+                "friendly_id": row.get("Command-Line Friendly ID",
+                                       "").strip(),
+                "item_id": row.get("Item ID", "").strip(),
+                "direction": row.get("Direction", "").strip(),
+                "type": row.get("Type", "").strip(),
+                "state": row.get("Device State", "").strip(),
+                "device_name": row.get("Device Name", "").strip(),
+            })
         return devices
     except Exception:
         return []
-    finally:
-        try:
-            tmp.unlink(missing_ok=True)
-        except OSError:
-            pass
 
 
-def find_svcl_device(devices: list[dict], name_contains: str,
-                     direction: str, dev_type: str = "Device") -> dict | None:
+def load_svcl_cache(max_age: float) -> tuple[list[dict], float] | None:
+    """Return (devices, age) from the disk cache if still valid."""
+    try:
+        with open(SVCL_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("svcl_mtime") != SVCL_PATH.stat().st_mtime:
+            return None
+        age = time.time() - cache.get("ts", 0)
+        if not 0 <= age <= max_age:
+            return None
+        return cache["devices"], age
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_svcl_cache(devices: list[dict]):
+    try:
+        write_json(SVCL_CACHE_PATH,
+                   {"svcl_mtime": SVCL_PATH.stat().st_mtime,
+                    "ts": time.time(), "devices": devices})
+    except OSError:
+        pass
+
+
+def index_svcl_devices(devices: list[dict]) -> dict[tuple[str, str], list[dict]]:
+    """Group devices by (direction, type) for repeated lookups."""
+    index: dict[tuple[str, str], list[dict]] = {}
     for d in devices:
-        if (name_contains.lower() in d["name"].lower()
-                and d["direction"] == direction
-                and d["type"] == dev_type):
+        index.setdefault((d["direction"], d["type"]), []).append(d)
+    return index
+
+
+def find_svcl_device(index: dict[tuple[str, str], list[dict]],
+                     name_contains: str, direction: str,
+                     dev_type: str = "Device") -> dict | None:
+    needle = name_contains.lower()
+    for d in index.get((direction, dev_type), ()):
+        if needle in d["name_lower"]:
             return d
     return None
 
@@ -160,86 +227,262 @@ def extract_guid(item_id: str) -> str | None:
 # ---------------------------------------------------------------------------
 # "Listen to this device" via registry (requires admin)
 # ---------------------------------------------------------------------------
-def build_listen_ps_script(b2_guid: str, target_endpoint_id: str) -> str:
-    return f'''
-$ErrorActionPreference = "Stop"
-$keyPath = "HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\MMDevices\\Audio\\Capture\\{b2_guid}\\Properties"
-
-if (-not (Test-Path $keyPath)) {{
-    Write-Error "Registry path not found: $keyPath"
-    exit 1
-}}
-
-Set-ItemProperty -Path $keyPath -Name "{LISTEN_PROP_GUID},0" -Value "{target_endpoint_id}" -Type String
-
-$bytes1 = [byte[]]@({LISTEN_BYTES_1})
-Set-ItemProperty -Path $keyPath -Name "{LISTEN_PROP_GUID},1" -Value $bytes1 -Type Binary
+def run_elevated_ps_file(script_path: Path,
+                         args: dict[str, str]) -> tuple[bool, str]:
+    """Run a shipped .ps1 elevated, passing args as -Name "value"."""
+    if not script_path.exists():
+        return False, f"{script_path.name} not found"
+    params = " ".join(f'-{k} "{v}"' for k, v in args.items())
+    try:
+        code = _run_elevated(
+            "powershell.exe",
+            f'-NoProfile -NonInteractive -ExecutionPolicy Bypass '
+            f'-WindowStyle Hidden -File "{script_path}" {params}',
+            timeout=10,
+        )
+        if code is None:
+            return False, "Timed out waiting for elevated script"
+        if code != 0:
+            return False, f"Elevated script failed (exit code {code})"
+        return True, "OK"
+    except OSError as e:
+        if getattr(e, "winerror", None) == ERROR_CANCELLED:
+            return False, "UAC prompt was declined or elevation failed"
+        return False, str(e)
+    except Exception as e:
+        return False, str(e)
 
-$bytes2 = [byte[]]@({LISTEN_BYTES_2})
-Set-ItemProperty -Path $keyPath -Name "{LISTEN_PROP_GUID},2" -Value $bytes2 -Type Binary
 
-Write-Host "Listen to device configured successfully"
-exit 0
-'''
+def apply_listen_registry(b2_guid: str, target_endpoint_id: str):
+    """Write the Listen values directly. Must be run elevated."""
+    import winreg
+    key_path = ("SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\MMDevices"
+                f"\\Audio\\Capture\\{b2_guid}\\Properties")
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path, 0,
+                        winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as key:
+        winreg.SetValueEx(key, f"{LISTEN_PROP_GUID},0", 0,
+                          winreg.REG_SZ, target_endpoint_id)
+        winreg.SetValueEx(key, f"{LISTEN_PROP_GUID},1", 0,
+                          winreg.REG_BINARY, LISTEN_BYTES_1)
+        winreg.SetValueEx(key, f"{LISTEN_PROP_GUID},2", 0,
+                          winreg.REG_BINARY, LISTEN_BYTES_2)
+
+
+def read_listen_target(b2_guid: str) -> str | None:
+    """Endpoint ID B2 is currently "listened" to, or None if Listen is off.
+
+    Reading HKLM needs no elevation.
+    """
+    import winreg
+    key_path = ("SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\MMDevices"
+                f"\\Audio\\Capture\\{b2_guid}\\Properties")
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path, 0,
+                            winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as key:
+            enabled, _ = winreg.QueryValueEx(key, f"{LISTEN_PROP_GUID},1")
+            target, _ = winreg.QueryValueEx(key, f"{LISTEN_PROP_GUID},0")
+    except OSError:
+        return None
+    if bytes(enabled) != LISTEN_BYTES_1 or not isinstance(target, str):
+        return None
+    return target
+
+
+class _SHELLEXECUTEINFOW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("fMask", wintypes.ULONG),
+        ("hwnd", wintypes.HWND),
+        ("lpVerb", wintypes.LPCWSTR),
+        ("lpFile", wintypes.LPCWSTR),
+        ("lpParameters", wintypes.LPCWSTR),
+        ("lpDirectory", wintypes.LPCWSTR),
+        ("nShow", ctypes.c_int),
+        ("hInstApp", wintypes.HINSTANCE),
+        ("lpIDList", ctypes.c_void_p),
+        ("lpClass", wintypes.LPCWSTR),
+        ("hkeyClass", wintypes.HKEY),
+        ("dwHotKey", wintypes.DWORD),
+        ("hIconOrMonitor", wintypes.HANDLE),
+        ("hProcess", wintypes.HANDLE),
+    ]
+
+
+SEE_MASK_NOCLOSEPROCESS = 0x00000040
+SEE_MASK_NOASYNC = 0x00000100
+ERROR_CANCELLED = 1223
+WAIT_OBJECT_0 = 0
+
+
+def _run_elevated(exe: str, params: str, timeout: float = 30) -> int | None:
+    """Run exe elevated and wait for it. Returns the exit code, or None on
+    timeout. Raises OSError if the process could not be started (including
+    a declined UAC prompt, winerror == ERROR_CANCELLED)."""
+    sei = _SHELLEXECUTEINFOW()
+    sei.cbSize = ctypes.sizeof(sei)
+    sei.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_NOASYNC
+    sei.lpVerb = "runas"
+    sei.lpFile = exe
+    sei.lpParameters = params
+    sei.lpDirectory = str(SCRIPT_DIR)
+    sei.nShow = 0  # SW_HIDE
+    if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(sei)):
+        raise ctypes.WinError()
+    if not sei.hProcess:
+        return None
+
+    kernel32 = ctypes.windll.kernel32
+    try:
+        if kernel32.WaitForSingleObject(
+                sei.hProcess, int(timeout * 1000)) != WAIT_OBJECT_0:
+            return None
+        code = wintypes.DWORD()
+        kernel32.GetExitCodeProcess(sei.hProcess, ctypes.byref(code))
+        return code.value
+    finally:
+        kernel32.CloseHandle(sei.hProcess)
 
 
-def run_elevated_ps(script: str) -> tuple[bool, str]:
-    script_path = SCRIPT_DIR / "_listen_setup.ps1"
-    result_path = SCRIPT_DIR / "_listen_result.txt"
+def run_elevated_listen(b2_guid: str,
+                        target_endpoint_id: str) -> tuple[bool, str]:
+    """Apply the Listen registry values from an elevated copy of this script.
+    Falls back to the PowerShell route if Python can't be launched."""
+    exe = _pythonw()
+    params = (f'"{SCRIPT_DIR / "setup_wizard.py"}" --apply-listen '
+              f'"{b2_guid}" "{target_endpoint_id}"')
     try:
-        full_script = (script
-                       + f'\n"OK" | Out-File -FilePath "{result_path}"'
-                         ' -Encoding utf8\n')
-        script_path.write_text(full_script, encoding="utf-8")
-        result_path.unlink(missing_ok=True)
-
-        ctypes.windll.shell32.ShellExecuteW.restype = ctypes.c_void_p
-        ret = ctypes.windll.shell32.ShellExecuteW(
-            None, "runas", "powershell.exe",
-            f'-ExecutionPolicy Bypass -WindowStyle Hidden '
-            f'-File "{script_path}"',
-            None, 0,
-        )
-        if (ret or 0) <= 32:
+        code = _run_elevated(str(exe), params)
+    except OSError as e:
+        if getattr(e, "winerror", None) == ERROR_CANCELLED:
             return False, "UAC prompt was declined or elevation failed"
+        # The byte values travel as hex so LISTEN_BYTES_* stay the only copy
+        return run_elevated_ps_file(
+            LISTEN_PS_PATH,
+            {"b2Guid": b2_guid, "targetId": target_endpoint_id,
+             "bytes1": LISTEN_BYTES_1.hex(), "bytes2": LISTEN_BYTES_2.hex()})
+    if code is None:
+        return False, "Timed out waiting for elevated helper"
+    if code != 0:
+        return False, f"Elevated helper failed (exit code {code})"
+    return True, "OK"
 
-        for _ in range(20):
-            time.sleep(0.5)
-            if result_path.exists():
-                return True, "OK"
 
-        return False, "Timed out waiting for elevated script"
-    except Exception as e:
-        return False, str(e)
-    finally:
-        try:
-            script_path.unlink(missing_ok=True)
-        except OSError:
-            pass
-        try:
-            result_path.unlink(missing_ok=True)
-        except OSError:
-            pass
+# ---------------------------------------------------------------------------
+# Downloads
+# ---------------------------------------------------------------------------
+def _download_file(url: str, dest: Path, timeout: float = 30):
+    """Stream url to dest in 64KB chunks."""
+    import shutil
+    import urllib.request
+    with urllib.request.urlopen(url, timeout=timeout) as r, \
+         open(dest, "wb") as f:
+        shutil.copyfileobj(r, f, 1 << 16)
+
+
+def _requirement_specs(names: list[str]) -> list[str]:
+    """Map package names to their requirements.txt lines (keeps pins)."""
+    import re
+    wanted = {n.lower() for n in names}
+    specs = []
+    try:
+        lines = (SCRIPT_DIR / "requirements.txt").read_text(
+            encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        name = re.split(r"[<>=!~\[;\s]", line, maxsplit=1)[0].lower()
+        if name in wanted:
+            specs.append(line)
+            wanted.discard(name)
+    return specs + sorted(wanted)
+
+
+def _version_tuple(v: str) -> tuple[int, ...]:
+    """'6.1.0' -> (6, 1, 0); stops at the first non-numeric part."""
+    parts = []
+    for p in v.split("."):
+        if not p.isdigit():
+            break
+        parts.append(int(p))
+    return tuple(parts)
+
+
+def _requirement_floor(name: str) -> tuple[int, ...] | None:
+    """Minimum version from a 'name>=X.Y' line in requirements.txt."""
+    import re
+    for spec in _requirement_specs([name]):
+        m = re.search(r">=\s*([\d.]+)", spec)
+        if m:
+            return _version_tuple(m.group(1))
+    return None
 
 
 # ---------------------------------------------------------------------------
 # Shortcut creation
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _pythonw() -> Path:
+    """pythonw.exe next to the running interpreter, else the interpreter."""
+    pythonw = Path(sys.executable).parent / "pythonw.exe"
+    return pythonw if pythonw.exists() else Path(sys.executable)
+
+
 def create_shortcut(target: str, shortcut_path: str, args: str = "",
                     description: str = ""):
+    err = create_shortcuts_batch([(target, shortcut_path, args,
+                                   description)])[0]
+    if err:
+        raise err
+
+
+def create_shortcuts_batch(
+        specs: list[tuple[str, str, str, str]]) -> list[Exception | None]:
+    """Create (target, shortcut_path, args, description) shortcuts in one
+    COM session. Returns a per-shortcut error (or None)."""
+    try:
+        import pythoncom
+        from win32com.client import Dispatch
+    except ImportError:
+        _create_shortcuts_ps(specs)
+        return [None] * len(specs)
+    results: list[Exception | None] = []
+    pythoncom.CoInitialize()
+    try:
+        shell = Dispatch("WScript.Shell")
+        for target, shortcut_path, args, description in specs:
+            try:
+                sc = shell.CreateShortcut(shortcut_path)
+                sc.TargetPath = target
+                sc.Arguments = args
+                sc.WorkingDirectory = str(SCRIPT_DIR)
+                sc.Description = description
+                sc.Save()
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+    finally:
+        pythoncom.CoUninitialize()
+    return results
+
+
+def _create_shortcuts_ps(specs: list[tuple[str, str, str, str]]):
+    """Fallback when pywin32 isn't installed: one script for all shortcuts."""
     ps_script = SCRIPT_DIR / "_mkshortcut.ps1"
-    ps_script.write_text(f'''
-$ws = New-Object -ComObject WScript.Shell
+    body = "$ws = New-Object -ComObject WScript.Shell\n"
+    for target, shortcut_path, args, description in specs:
+        body += f'''
 $sc = $ws.CreateShortcut("{shortcut_path}")
 $sc.TargetPath = "{target}"
 $sc.Arguments = '{args}'
 $sc.WorkingDirectory = "{SCRIPT_DIR}"
 $sc.Description = "{description}"
 $sc.Save()
-''', encoding="utf-8")
+'''
+    ps_script.write_text(body, encoding="utf-8")
     subprocess.run(
-        ["powershell", "-ExecutionPolicy", "Bypass", "-File",
-         str(ps_script)],
+        ["powershell", "-NoProfile", "-NonInteractive",
+         "-ExecutionPolicy", "Bypass", "-File", str(ps_script)],
         capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW,
     )
     ps_script.unlink(missing_ok=True)
@@ -268,21 +511,31 @@ class SetupWizard:
 
         self._vm_inputs: list[dict] = []
         self._svcl_devices: list[dict] = []
+        self._svcl_index: dict[tuple[str, str], list[dict]] = {}
+        self._svcl_render_by_full_name: dict[str, dict] = {}
+        self._svcl_cache_ts = 0.0
         self._vm_launched_by_us = False
+        self._vm_proc: subprocess.Popen | None = None
         self._resuming = False
+        self._vm_running_cache = (0.0, False)  # (monotonic ts, running)
+        # Set by the prereq check; re-checked only after running the installer
+        self._vm_dll_present = False
+        self._log_queue: collections.deque[str] = collections.deque()
+        self._log_flush_pending = False
+        # Only one VoiceMeeter login/enumeration at a time
+        self._detect_lock = threading.Lock()
 
         self._setup_file_logging()
         self._cleanup_resume_shortcut()
         self._build_ui()
         self._center()
 
-        # If all prerequisites are met, skip to device config phase
-        if self._all_prerequisites_met():
-            self._show_phase("installing")
-            threading.Thread(target=self._install_thread,
-                             daemon=True).start()
-        else:
-            self._show_phase("start")
+        # Check prerequisites off the UI thread; if all are met we skip
+        # straight to device detection once the results come back.
+        self._install_started = False
+        self._show_phase("start")
+        self._start_btn.config(state="disabled")
+        threading.Thread(target=self._check_prereqs_bg, daemon=True).start()
 
     # ------------------------------------------------------------------
     # Logging
@@ -303,13 +556,26 @@ class SetupWizard:
         self._file_log.info("Script dir: %s", SCRIPT_DIR)
 
     def _log(self, msg):
+        """Queue a log line (any thread); lines are flushed in one batch."""
+        self._log_queue.append(msg)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_pending = False
+        msgs = []
+        while self._log_queue:
+            msgs.append(self._log_queue.popleft())
+        if not msgs:
+            return
         self.log_text.config(state="normal")
-        self.log_text.insert("end", msg + "\n")
+        self.log_text.insert("end", "".join(m + "\n" for m in msgs))
         self.log_text.see("end")
         self.log_text.config(state="disabled")
-        self.root.update_idletasks()
-        if msg.strip():
-            self._file_log.info(msg)
+        for msg in msgs:
+            if msg.strip():
+                self._file_log.info(msg)
 
     def _ui(self, fn):
         self.root.after(0, fn)
@@ -330,19 +596,93 @@ class SetupWizard:
     # ------------------------------------------------------------------
     # Prerequisites check
     # ------------------------------------------------------------------
-    def _all_prerequisites_met(self) -> bool:
-        return (sys.version_info >= (3, 10)
-                and find_dll() is not None
-                and SVCL_PATH.exists()
-                and all(self._check_pkg(p) for p in REQUIRED_PACKAGES))
+    def _check_prereqs_bg(self):
+        """Run the independent prerequisite checks concurrently."""
+        # Imported here, off the UI thread, to keep the first window fast
+        from concurrent.futures import ThreadPoolExecutor
+        checks = {
+            "python": lambda: sys.version_info >= (3, 10),
+            "voicemeeter": self._check_vm_dll,
+            "svcl": SVCL_PATH.exists,
+            "packages": lambda: all(self._check_pkg(p)
+                                    for p in REQUIRED_PACKAGES),
+        }
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = {key: pool.submit(fn) for key, fn in checks.items()}
+        results = {}
+        for key, fut in futures.items():
+            try:
+                results[key] = bool(fut.result())
+            except Exception:
+                results[key] = False
+        config_ok = (all(results.values()) and not self._resuming
+                     and self._existing_config_valid())
+        self.root.after(0, self._apply_prereq_results, results, config_ok)
+
+    def _check_vm_dll(self) -> bool:
+        self._vm_dll_present = find_dll() is not None
+        return self._vm_dll_present
+
+    def _existing_config_valid(self) -> bool:
+        """True if the parts of a previous setup that can go stale still
+        hold: a saved mic, and B2 listened to a live playback device."""
+        try:
+            with open(VM_DEVICES_PATH, encoding="utf-8") as f:
+                if not json.load(f).get("Strip[0]"):
+                    return False
+            with open(CONFIG_PATH, encoding="utf-8") as f:
+                if not json.load(f).get("vr_device"):
+                    return False
+        except (OSError, ValueError, AttributeError):
+            return False
+        try:
+            index = self._get_svcl_index()
+        except Exception:
+            return False
+        # The Listen target is the headset output picked last time; it
+        # disappears when the headset is unplugged or replaced
+        b2_dev = find_svcl_device(index, "Voicemeeter Out B2", "Capture")
+        b2_guid = extract_guid(b2_dev["item_id"]) if b2_dev else None
+        target = read_listen_target(b2_guid) if b2_guid else None
+        if not target:
+            return False
+        return any(d["item_id"] == target and d["state"] == "Active"
+                   for d in index.get(("Render", "Device"), ()))
+
+    def _apply_prereq_results(self, results: dict[str, bool],
+                              config_ok: bool = False):
+        self._file_log.info("Prerequisites: %s", results)
+        if config_ok:
+            # Already set up; go straight to Launch with a way back in
+            self._log("Existing setup is still valid.")
+            self._rerun_btn.pack(anchor="w", pady=(12, 0))
+            self._show_phase("done")
+        elif all(results.values()):
+            self._start_install()
+        else:
+            self._start_btn.config(state="normal")
+
+    def _on_rerun_click(self):
+        self._rerun_btn.pack_forget()
+        self._start_install()
 
     @staticmethod
     def _check_pkg(name):
+        """Importable, and at least the requirements.txt >= floor if any."""
         try:
             __import__(name)
-            return True
         except ImportError:
             return False
+        floor = _requirement_floor(name)
+        if floor is None:
+            return True
+        from importlib import metadata
+        try:
+            # Read from disk, so a pip upgrade in this run is seen
+            installed = _version_tuple(metadata.version(name))
+        except metadata.PackageNotFoundError:
+            return False
+        return installed >= floor
 
     # ------------------------------------------------------------------
     # UI: Build all phases
@@ -546,6 +886,15 @@ class SetupWizard:
         )
         self._launch_btn.pack(anchor="w")
 
+        # Only packed when startup found an existing, valid setup
+        self._rerun_btn = tk.Button(
+            f, text="\u21bb Run setup again", bg=self.btn_bg,
+            fg=self.fg, activebackground=self.btn_act,
+            activeforeground=self.fg, relief="flat", padx=8, pady=3,
+            font=("Segoe UI", 8), cursor="hand2",
+            command=self._on_rerun_click,
+        )
+
         return f
 
     def _build_phase_reboot(self) -> tk.Frame:
@@ -640,6 +989,12 @@ class SetupWizard:
     # Phase 1: Set Up Everything clicked
     # ------------------------------------------------------------------
     def _on_setup_click(self):
+        self._start_install()
+
+    def _start_install(self):
+        if self._install_started:
+            return
+        self._install_started = True
         self._start_btn.config(state="disabled")
         self._show_phase("installing")
         threading.Thread(target=self._install_thread,
@@ -649,234 +1004,225 @@ class SetupWizard:
     # Phase 2: Install thread
     # ------------------------------------------------------------------
     def _install_thread(self):
-        def log(msg):
-            self._ui(lambda: self._log(msg))
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        log = self._log
         def check(key, ok):
             self._ui(lambda: self._set_check(key, ok))
 
-        # --- VoiceMeeter ---
-        if find_dll():
-            check("voicemeeter", True)
-            log("VoiceMeeter found")
-        else:
-            log("Downloading VoiceMeeter installer...")
-            try:
-                import urllib.request, zipfile
-                vm_zip = SCRIPT_DIR / "_VoicemeeterSetup.zip"
-                urllib.request.urlretrieve(VM_DOWNLOAD_URL, str(vm_zip))
-                log("Extracting installer...")
-                with zipfile.ZipFile(str(vm_zip), 'r') as zf:
-                    exe_names = [n for n in zf.namelist()
-                                 if n.lower().endswith('.exe')]
-                    if not exe_names:
-                        raise RuntimeError("No .exe found in VoiceMeeter ZIP")
-                    zf.extract(exe_names[0], str(SCRIPT_DIR))
-                    installer = SCRIPT_DIR / exe_names[0]
-                vm_zip.unlink(missing_ok=True)
-                log("Launching VoiceMeeter installer...")
-                log("Click Install in the VoiceMeeter window.")
-                import ctypes
-                ret = ctypes.windll.shell32.ShellExecuteW(
-                    None, "runas", str(installer), None, None, 1)
-                if ret <= 32:
-                    raise RuntimeError(f"Failed to launch installer (code {ret})")
-                # Poll for VoiceMeeter DLL to appear (means install finished)
-                # rather than waiting for the installer process to exit,
-                # since the installer stays open showing the reboot dialog.
-                log("Waiting for installation to complete...")
-                time.sleep(5)
-                for _ in range(120):  # Up to ~4 minutes
-                    if find_dll():
-                        break
-                    time.sleep(2)
-                time.sleep(2)
-                # Auto-close the reboot dialog and installer window
-                log("Closing installer windows...")
+        # The three installs are independent: overlap their downloads
+        steps = {
+            "voicemeeter": self._install_voicemeeter,
+            "svcl": self._install_svcl,
+            "packages": self._install_packages,
+        }
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = {pool.submit(fn, log): key for key, fn in steps.items()}
+            for fut in as_completed(futures):
+                key = futures[fut]
                 try:
-                    _close_ps = SCRIPT_DIR / "_close_vm.ps1"
-                    _close_ps.write_text(
-                        '$wshell = New-Object -ComObject wscript.shell\n'
-                        'Start-Sleep -Seconds 1\n'
-                        '$wshell.AppActivate("RESTART YOUR SYSTEM")\n'
-                        'Start-Sleep -Milliseconds 500\n'
-                        '$wshell.SendKeys("{ENTER}")\n'
-                        'Start-Sleep -Seconds 1\n'
-                        '$wshell.AppActivate("Voicemeeter Installation")\n'
-                        'Start-Sleep -Milliseconds 500\n'
-                        '$wshell.SendKeys("%{F4}")\n'
-                        'Start-Sleep -Seconds 1\n'
-                        'Stop-Process -Name VoicemeeterProSetup -Force '
-                        '-ErrorAction SilentlyContinue\n',
-                        encoding='utf-8'
-                    )
-                    subprocess.run(
-                        ["powershell", "-ExecutionPolicy", "Bypass",
-                         "-File", str(_close_ps)],
-                        timeout=15, capture_output=True)
-                    _close_ps.unlink(missing_ok=True)
-                except Exception:
-                    pass  # Non-critical, user can close manually
-                installer.unlink(missing_ok=True)
-
-                time.sleep(3)
-                if find_dll():
-                    check("voicemeeter", True)
-                    log("VoiceMeeter installed!")
-                else:
-                    check("voicemeeter", True)
-                    log("VoiceMeeter installed! Restart needed.")
-                    self._ui(lambda: self._start_reboot_countdown())
-                    return
-            except Exception as e:
-                check("voicemeeter", False)
-                log(f"VoiceMeeter download failed: {e}")
-                log("Install manually: vb-audio.com/Voicemeeter/banana.htm")
-                return
+                    ok, msg = fut.result()
+                except Exception as e:
+                    ok, msg = False, f"{key} setup failed: {e}"
+                results[key] = ok
+                check(key, ok)
+                log(msg)
+        if not all(results.values()):
+            return
+        if not self._vm_dll_present:
+            log("Restart needed to finish the VoiceMeeter install.")
+            self._ui(lambda: self._start_reboot_countdown())
+            return
 
-        # --- svcl.exe ---
-        if SVCL_PATH.exists():
-            check("svcl", True)
-            log("svcl.exe found")
-        else:
-            log("Downloading svcl.exe...")
-            try:
-                import urllib.request
-                import zipfile
-                zip_path = SCRIPT_DIR / "_svcl.zip"
-                urllib.request.urlretrieve(SVCL_URL, str(zip_path))
-                with zipfile.ZipFile(str(zip_path), "r") as zf:
-                    for name in zf.namelist():
-                        if name.lower() == "svcl.exe":
-                            with zf.open(name) as src, \
-                                 open(str(SVCL_PATH), "wb") as dst:
-                                dst.write(src.read())
-                            break
-                zip_path.unlink(missing_ok=True)
-                if SVCL_PATH.exists():
-                    check("svcl", True)
-                    log("svcl.exe downloaded")
-                else:
-                    check("svcl", False)
-                    log("svcl.exe missing after download. Your antivirus "
-                        "may have quarantined it.")
-                    log("Add an exception for svcl.exe and re-run setup.")
-                    return
-            except Exception as e:
-                check("svcl", False)
-                log(f"svcl download failed: {e}")
-                return
+        # --- Device detection ---
+        log("Detecting audio devices...")
+        self._detect_lock.acquire()
+        self._detect_devices_worker(from_install=True)
 
-        # --- Python packages ---
-        if all(self._check_pkg(p) for p in REQUIRED_PACKAGES):
-            check("packages", True)
-            log("Python packages OK")
-        else:
-            log("Installing Python packages...")
+    def _install_voicemeeter(self, log) -> tuple[bool, str]:
+        if self._vm_dll_present:
+            return True, "VoiceMeeter found"
+        log("Downloading VoiceMeeter installer...")
+        try:
+            import zipfile
+            vm_zip = SCRIPT_DIR / "_VoicemeeterSetup.zip"
+            _download_file(VM_DOWNLOAD_URL, vm_zip, timeout=60)
+            log("Extracting installer...")
+            with zipfile.ZipFile(str(vm_zip), 'r') as zf:
+                exe_names = [n for n in zf.namelist()
+                             if n.lower().endswith('.exe')]
+                if not exe_names:
+                    raise RuntimeError("No .exe found in VoiceMeeter ZIP")
+                zf.extract(exe_names[0], str(SCRIPT_DIR))
+                installer = SCRIPT_DIR / exe_names[0]
+            vm_zip.unlink(missing_ok=True)
+            log("Launching VoiceMeeter installer...")
+            log("Click Install in the VoiceMeeter window.")
+            ret = ctypes.windll.shell32.ShellExecuteW(
+                None, "runas", str(installer), None, None, 1)
+            if ret <= 32:
+                raise RuntimeError(f"Failed to launch installer (code {ret})")
+            # The install may land somewhere new: drop any remembered
+            # DLL/EXE paths, in memory and in _vm_path_cache.json
+            clear_vm_path_cache()
+            # Poll for VoiceMeeter DLL to appear (means install finished)
+            # rather than waiting for the installer process to exit,
+            # since the installer stays open showing the reboot dialog.
+            log("Waiting for installation to complete...")
+            time.sleep(5)
+            for _ in range(120):  # Up to ~4 minutes
+                if find_dll():
+                    break
+                time.sleep(2)
+            time.sleep(2)
+            # Auto-close the reboot dialog and installer window
+            log("Closing installer windows...")
             try:
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-r",
-                     str(SCRIPT_DIR / "requirements.txt")],
-                    capture_output=True, text=True, timeout=120,
+                _close_ps = SCRIPT_DIR / "_close_vm.ps1"
+                _close_ps.write_text(
+                    '$wshell = New-Object -ComObject wscript.shell\n'
+                    'Start-Sleep -Seconds 1\n'
+                    '$wshell.AppActivate("RESTART YOUR SYSTEM")\n'
+                    'Start-Sleep -Milliseconds 500\n'
+                    '$wshell.SendKeys("{ENTER}")\n'
+                    'Start-Sleep -Seconds 1\n'
+                    '$wshell.AppActivate("Voicemeeter Installation")\n'
+                    'Start-Sleep -Milliseconds 500\n'
+                    '$wshell.SendKeys("%{F4}")\n'
+                    'Start-Sleep -Seconds 1\n'
+                    'Stop-Process -Name VoicemeeterProSetup -Force '
+                    '-ErrorAction SilentlyContinue\n',
+                    encoding='utf-8'
                 )
-                if result.returncode == 0:
-                    check("packages", True)
-                    log("Packages installed")
-                else:
-                    check("packages", False)
-                    log(f"pip error: {result.stderr[:200]}")
-                    return
-            except Exception as e:
-                check("packages", False)
-                log(f"Package install failed: {e}")
-                return
+                subprocess.run(
+                    ["powershell", "-NoProfile", "-NonInteractive",
+                     "-ExecutionPolicy", "Bypass",
+                     "-File", str(_close_ps)],
+                    timeout=15, capture_output=True,
+                    creationflags=subprocess.CREATE_NO_WINDOW)
+                _close_ps.unlink(missing_ok=True)
+            except Exception:
+                pass  # Non-critical, user can close manually
+            installer.unlink(missing_ok=True)
+
+            time.sleep(3)
+            self._check_vm_dll()
+            return True, "VoiceMeeter installed!"
+        except Exception as e:
+            return False, (f"VoiceMeeter download failed: {e}\n"
+                           "Install manually: vb-audio.com/Voicemeeter/banana.htm")
 
-        # --- Device detection ---
-        log("Detecting audio devices...")
+    def _install_svcl(self, log) -> tuple[bool, str]:
+        if SVCL_PATH.exists():
+            return True, "svcl.exe found"
+        log("Downloading svcl.exe...")
         try:
-            self._ensure_voicemeeter()
-            vm = VMDeviceEnumerator()
-            self._vm_inputs = vm.input_devices()
-            vm_outputs = vm.output_devices()
-            vm.close()
-
-            wdm_inputs = [d for d in self._vm_inputs if d["type"] == "wdm"]
-            mic_names = [d["name"] for d in wdm_inputs]
-
-            wdm_outputs = [d for d in vm_outputs if d["type"] == "wdm"]
-            vr_names = [d["name"] for d in wdm_outputs
-                        if "voicemeeter" not in d["name"].lower()]
-
+            import shutil
+            import zipfile
+            zip_path = SCRIPT_DIR / "_svcl.zip"
+            _download_file(SVCL_URL, zip_path)
+            with zipfile.ZipFile(str(zip_path), "r") as zf:
+                for name in zf.namelist():
+                    if name.lower() == "svcl.exe":
+                        with zf.open(name) as src, \
+                             open(str(SVCL_PATH), "wb") as dst:
+                            shutil.copyfileobj(src, dst, 1 << 16)
+                        break
+            zip_path.unlink(missing_ok=True)
             if SVCL_PATH.exists():
-                self._svcl_devices = query_svcl_devices()
-
-            check("devices", True)
-            log(f"Found {len(mic_names)} mics, {len(vr_names)} outputs")
-
-            # Populate dropdowns on UI thread
-            def populate():
-                self.mic_combo["values"] = mic_names
-                if mic_names:
-                    sel = 0
-                    for i, name in enumerate(mic_names):
-                        nl = name.lower()
-                        if ("microphone" in nl or "mic" in nl) \
-                                and "steam" not in nl:
-                            sel = i
-                            break
-                    self.mic_combo.current(sel)
-
-                self.vr_combo["values"] = vr_names
-                if vr_names:
-                    sel = 0
-                    for i, name in enumerate(vr_names):
-                        if "steam streaming speakers" in name.lower():
-                            sel = i
-                            break
-                    self.vr_combo.current(sel)
-
-                self._show_phase("configure")
-
-            self._ui(populate)
+                return True, "svcl.exe downloaded"
+            return False, ("svcl.exe missing after download. Your antivirus "
+                           "may have quarantined it.\n"
+                           "Add an exception for svcl.exe and re-run setup.")
+        except Exception as e:
+            return False, f"svcl download failed: {e}"
 
+    def _install_packages(self, log) -> tuple[bool, str]:
+        missing = [p for p in REQUIRED_PACKAGES if not self._check_pkg(p)]
+        if not missing:
+            return True, "Python packages OK"
+        log(f"Installing Python packages ({', '.join(missing)})...")
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "pip", "install",
+                 "--disable-pip-version-check", "--no-input",
+                 *_requirement_specs(missing)],
+                capture_output=True, text=True, timeout=120,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+            if result.returncode == 0:
+                return True, "Packages installed"
+            return False, f"pip error: {result.stderr[:200]}"
         except Exception as e:
-            check("devices", False)
-            log(f"Device detection failed: {e}")
+            return False, f"Package install failed: {e}"
 
     def _ensure_voicemeeter(self):
+        ts, running = self._vm_running_cache
+        if running and time.monotonic() - ts < 5:
+            return
         try:
             import psutil
             for p in psutil.process_iter(["name"]):
                 if p.info["name"] and is_vm_process(p.info["name"]):
+                    self._vm_running_cache = (time.monotonic(), True)
                     return
         except ImportError:
             pass
         vm_exe = find_exe()
         if vm_exe:
             self._log(f"Launching VoiceMeeter ({vm_exe.name})...")
-            subprocess.Popen([str(vm_exe)],
-                             creationflags=subprocess.CREATE_NO_WINDOW)
+            self._vm_proc = subprocess.Popen(
+                [str(vm_exe)], creationflags=subprocess.CREATE_NO_WINDOW)
             self._vm_launched_by_us = True
-            time.sleep(4)
+            self._wait_for_voicemeeter()
+            self._vm_running_cache = (time.monotonic(), True)
+
+    def _wait_for_voicemeeter(self, timeout: float = 4.0):
+        """Poll the Remote API until VoiceMeeter answers, up to timeout."""
+        start = time.monotonic()
+        deadline = start + timeout
+        try:
+            dll = _get_vm_dll()
+        except (OSError, RuntimeError):
+            time.sleep(timeout)
+            return
+        dll.VBVMR_Login()
+        try:
+            vm_type = ctypes.c_long()
+            while time.monotonic() < deadline:
+                # Returns 0 once the VoiceMeeter server is up
+                if dll.VBVMR_GetVoicemeeterType(ctypes.byref(vm_type)) == 0:
+                    self._file_log.info("VoiceMeeter ready in %.1fs",
+                                        time.monotonic() - start)
+                    return
+                time.sleep(0.1)
+            self._file_log.info("VoiceMeeter not ready after %.0fs", timeout)
+        finally:
+            dll.VBVMR_Logout()
 
     # ------------------------------------------------------------------
     # Reboot flow
     # ------------------------------------------------------------------
     def _start_reboot_countdown(self):
         self._show_phase("reboot")
-        self._reboot_seconds = 15
+        self._reboot_deadline = time.monotonic() + 15
+        self._reboot_shown = None
         self._reboot_cancelled = False
         self._tick_reboot()
 
     def _tick_reboot(self):
         if self._reboot_cancelled:
             return
-        if self._reboot_seconds <= 0:
+        # Derive from a fixed deadline so a stalled UI thread can't drift
+        remaining = max(0, int(round(self._reboot_deadline - time.monotonic())))
+        if remaining <= 0:
             self._do_reboot()
             return
-        self._reboot_label.config(
-            text=f"Restarting in {self._reboot_seconds} seconds...")
-        self._reboot_seconds -= 1
-        self.root.after(1000, self._tick_reboot)
+        if remaining != self._reboot_shown:
+            self._reboot_shown = remaining
+            self._reboot_label.config(
+                text=f"Restarting in {remaining} seconds...")
+        self.root.after(200, self._tick_reboot)
 
     def _do_reboot(self):
         # Create resume shortcut so wizard auto-launches after reboot
@@ -889,8 +1235,10 @@ class SetupWizard:
         except Exception:
             pass
         self._log("Restarting PC...")
-        subprocess.Popen(["shutdown", "/r", "/t", "3"])
-        self.root.after(2000, self.root.destroy)
+        subprocess.Popen(["shutdown", "/r", "/t", "3"],
+                         creationflags=_POPEN_FLAGS)
+        # shutdown /t 3 is already scheduled OS-side; no need to linger
+        self.root.after(500, self.root.destroy)
 
     def _cancel_reboot(self):
         self._reboot_cancelled = True
@@ -909,8 +1257,7 @@ class SetupWizard:
                          daemon=True).start()
 
     def _finish_thread(self):
-        def log(msg):
-            self._ui(lambda: self._log(msg))
+        log = self._log
 
         mic_name = self.mic_var.get()
         vr_name = self.vr_var.get()
@@ -930,10 +1277,8 @@ class SetupWizard:
         # 1. Find VoiceMeeter VAIO svcl ID
         vaio_id = None
         if SVCL_PATH.exists():
-            if not self._svcl_devices:
-                self._svcl_devices = query_svcl_devices()
-            d = find_svcl_device(self._svcl_devices, "Voicemeeter Input",
-                                 "Render")
+            d = find_svcl_device(self._get_svcl_index(),
+                                 "Voicemeeter Input", "Render")
             if d:
                 vaio_id = d["friendly_id"]
         if not vaio_id:
@@ -952,16 +1297,14 @@ class SetupWizard:
             "vrchat_mic_confirmed": False,
         }
         try:
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(config, f, indent=2)
+            write_json(CONFIG_PATH, config, indent=2)
             log("config.json \u2713")
         except Exception as e:
             errors.append(f"config.json: {e}")
 
         # 3. vm_devices.json
         try:
-            with open(VM_DEVICES_PATH, "w") as f:
-                json.dump({"Strip[0]": mic_name}, f, indent=2)
+            write_json(VM_DEVICES_PATH, {"Strip[0]": mic_name}, indent=2)
             log(f"Microphone: {mic_name}")
         except Exception as e:
             errors.append(f"vm_devices.json: {e}")
@@ -973,46 +1316,44 @@ class SetupWizard:
         else:
             log("Audio routing: manual step needed")
 
-        # 5. Shortcuts
-        pythonw = Path(sys.executable).parent / "pythonw.exe"
-        if not pythonw.exists():
-            pythonw = Path(sys.executable)
+        # 5. Shortcuts (desktop + startup, one COM session)
+        pythonw = str(_pythonw())
         script = str(SCRIPT_DIR / "vr_audio_switcher.py")
 
+        import winreg
         try:
-            import winreg
-            try:
-                with winreg.OpenKey(
-                    winreg.HKEY_CURRENT_USER,
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion"
-                    r"\Explorer\User Shell Folders") as key:
-                    desktop_raw, _ = winreg.QueryValueEx(key, "Desktop")
-                    desktop = Path(os.path.expandvars(desktop_raw))
-            except OSError:
-                desktop = Path(os.environ["USERPROFILE"]) / "Desktop"
-            create_shortcut(str(pythonw),
-                            str(desktop / "VR Audio Switcher.lnk"),
-                            args=f'"{script}"',
-                            description="VR Audio Switcher")
-            log("Desktop shortcut \u2713")
-        except Exception as e:
-            errors.append(f"Desktop shortcut: {e}")
-
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                r"SOFTWARE\Microsoft\Windows\CurrentVersion"
+                r"\Explorer\User Shell Folders") as key:
+                desktop_raw, _ = winreg.QueryValueEx(key, "Desktop")
+                desktop = Path(os.path.expandvars(desktop_raw))
+        except OSError:
+            desktop = Path(os.environ.get("USERPROFILE", "")) / "Desktop"
+        startup = (Path(os.environ.get("APPDATA", ""))
+                   / "Microsoft" / "Windows" / "Start Menu"
+                   / "Programs" / "Startup")
+        shortcuts = [
+            ("Desktop shortcut",
+             (pythonw, str(desktop / "VR Audio Switcher.lnk"),
+              f'"{script}"', "VR Audio Switcher")),
+            ("Startup shortcut",
+             (pythonw, str(startup / "VR Audio Switcher.lnk"),
+              f'"{script}"', "VR Audio Switcher (auto-start)")),
+        ]
         try:
-            startup = (Path(os.environ["APPDATA"])
-                       / "Microsoft" / "Windows" / "Start Menu"
-                       / "Programs" / "Startup")
-            create_shortcut(str(pythonw),
-                            str(startup / "VR Audio Switcher.lnk"),
-                            args=f'"{script}"',
-                            description="VR Audio Switcher (auto-start)")
-            log("Startup shortcut \u2713")
+            results = create_shortcuts_batch([spec for _, spec in shortcuts])
         except Exception as e:
-            errors.append(f"Startup shortcut: {e}")
+            results = [e] * len(shortcuts)
+        for (label, _), err in zip(shortcuts, results):
+            if err:
+                errors.append(f"{label}: {err}")
+            else:
+                log(f"{label} \u2713")
 
         # 6. Shut down VoiceMeeter
         if self._vm_launched_by_us:
-            self._ui(lambda: self._shutdown_voicemeeter())
+            self._shutdown_voicemeeter()
 
         if errors:
             for err in errors:
@@ -1026,14 +1367,11 @@ class SetupWizard:
             self._ui(lambda: self._show_phase("done"))
 
     def _configure_listen(self, vr_output_name: str) -> bool:
-        if not self._svcl_devices:
-            if SVCL_PATH.exists():
-                self._svcl_devices = query_svcl_devices()
-            else:
-                return False
+        if not SVCL_PATH.exists():
+            return False
+        index = self._get_svcl_index()
 
-        b2_dev = find_svcl_device(self._svcl_devices, "Voicemeeter Out B2",
-                                  "Capture")
+        b2_dev = find_svcl_device(index, "Voicemeeter Out B2", "Capture")
         if not b2_dev:
             self._log("Could not find Voicemeeter Out B2")
             return False
@@ -1042,17 +1380,12 @@ class SetupWizard:
         if not b2_guid:
             return False
 
-        target_dev = None
-        for d in self._svcl_devices:
-            if (d["direction"] == "Render" and d["type"] == "Device"
-                    and d["state"] == "Active"):
-                svcl_full = f"{d['name']} ({d['device_name']})"
-                if svcl_full == vr_output_name:
-                    target_dev = d
-                    break
-                if d["device_name"] and d["device_name"] in vr_output_name:
-                    target_dev = d
-                    break
+        target_dev = self._svcl_render_by_full_name.get(vr_output_name)
+        if not target_dev:
+            target_dev = next(
+                (d for d in self._svcl_render_by_full_name.values()
+                 if d["device_name"] and d["device_name"] in vr_output_name),
+                None)
         if not target_dev:
             return False
 
@@ -1060,9 +1393,18 @@ class SetupWizard:
         if not target_endpoint_id:
             return False
 
-        ps = build_listen_ps_script(b2_guid, target_endpoint_id)
+        # Already elevated (e.g. install.bat run as admin)? Write in-process.
+        try:
+            apply_listen_registry(b2_guid, target_endpoint_id)
+            return True
+        except PermissionError:
+            pass
+        except OSError as e:
+            self._file_log.info("Listen registry write failed: %s", e)
+            return False
+
         self._log("Requesting admin permission for audio config...")
-        ok, _ = run_elevated_ps(ps)
+        ok, _ = run_elevated_listen(b2_guid, target_endpoint_id)
         return ok
 
     def _show_manual_listen(self, vr_name: str):
@@ -1089,10 +1431,19 @@ class SetupWizard:
         )
         subprocess.Popen(
             ["rundll32.exe", "Shell32.dll,Control_RunDLL", "mmsys.cpl,,1"],
-            creationflags=subprocess.CREATE_NO_WINDOW,
+            creationflags=_POPEN_FLAGS,
         )
 
     def _shutdown_voicemeeter(self):
+        # We still hold the handle if we launched it: no process scan needed
+        if self._vm_proc is not None and self._vm_proc.poll() is None:
+            try:
+                self._vm_proc.kill()
+                return
+            except OSError:
+                pass
+        if kill_vm_processes():
+            return
         try:
             import psutil
             for proc in psutil.process_iter(["name"]):
@@ -1102,23 +1453,75 @@ class SetupWizard:
         except Exception:
             pass
 
+    # ------------------------------------------------------------------
+    # svcl device cache
+    # ------------------------------------------------------------------
+    def _refresh_svcl_devices(self) -> list[dict]:
+        """Re-run svcl.exe and stamp the cache."""
+        self._set_svcl_devices(query_svcl_devices())
+        if self._svcl_devices:
+            save_svcl_cache(self._svcl_devices)
+        return self._svcl_devices
+
+    def _set_svcl_devices(self, devices: list[dict], age: float = 0.0):
+        self._svcl_devices = devices
+        self._svcl_index = index_svcl_devices(devices)
+        # Active playback endpoints keyed by "Name (Device Name)", the
+        # same form VoiceMeeter reports in the VR output dropdown
+        by_full: dict[str, dict] = {}
+        for d in self._svcl_index.get(("Render", "Device"), ()):
+            if d["state"] == "Active":
+                by_full.setdefault(f"{d['name']} ({d['device_name']})", d)
+        self._svcl_render_by_full_name = by_full
+        self._svcl_cache_ts = time.monotonic() - age
+
+    def _get_svcl_devices(self, max_age: float = SVCL_CACHE_TTL,
+                          force: bool = False) -> list[dict]:
+        """Return cached svcl devices, re-querying only if empty or stale."""
+        if (force or not self._svcl_devices
+                or time.monotonic() - self._svcl_cache_ts > max_age):
+            cached = None if force else load_svcl_cache(
+                min(max_age, SVCL_DISK_CACHE_TTL))
+            if cached:
+                self._set_svcl_devices(*cached)
+                return self._svcl_devices
+            return self._refresh_svcl_devices()
+        return self._svcl_devices
+
+    def _get_svcl_index(self, max_age: float = float("inf")
+                        ) -> dict[tuple[str, str], list[dict]]:
+        """(direction, type) index over the cached svcl devices.
+
+        By default this reuses whatever device detection (or Refresh)
+        last loaded, so the Finish flow doesn't spawn svcl.exe again.
+        """
+        self._get_svcl_devices(max_age=max_age)
+        return self._svcl_index
+
     # ------------------------------------------------------------------
     # Phase 4: Launch
     # ------------------------------------------------------------------
     def _launch(self):
-        pythonw = Path(sys.executable).parent / "pythonw.exe"
-        if not pythonw.exists():
-            pythonw = Path(sys.executable)
         script = str(SCRIPT_DIR / "vr_audio_switcher.py")
-        subprocess.Popen([str(pythonw), script])
+        subprocess.Popen([str(_pythonw()), script],
+                         creationflags=_POPEN_FLAGS)
         self._log("Launched!")
-        self.root.after(2000, self.root.destroy)
+        self.root.after_idle(self.root.destroy)
 
     # ------------------------------------------------------------------
-    # Device detection (for Refresh button in configure phase)
+    # Device detection (install flow and Refresh button)
     # ------------------------------------------------------------------
     def _detect_devices(self):
+        if not self._detect_lock.acquire(blocking=False):
+            return  # a detection is already running
+        self._refresh_btn.config(state="disabled")
         self._log("Refreshing devices...")
+        threading.Thread(target=self._detect_devices_worker,
+                         daemon=True).start()
+
+    def _detect_devices_worker(self, from_install: bool = False):
+        """Enumerate devices off the UI thread. Caller holds _detect_lock."""
+        log = self._log
         try:
             self._ensure_voicemeeter()
             vm = VMDeviceEnumerator()
@@ -1126,39 +1529,49 @@ class SetupWizard:
             vm_outputs = vm.output_devices()
             vm.close()
 
-            wdm_inputs = [d for d in self._vm_inputs if d["type"] == "wdm"]
-            mic_names = [d["name"] for d in wdm_inputs]
-            self.mic_combo["values"] = mic_names
-            if mic_names:
-                sel = 0
-                for i, name in enumerate(mic_names):
-                    nl = name.lower()
-                    if ("microphone" in nl or "mic" in nl) \
-                            and "steam" not in nl:
-                        sel = i
-                        break
-                self.mic_combo.current(sel)
-
-            wdm_outputs = [d for d in vm_outputs if d["type"] == "wdm"]
-            vr_names = [d["name"] for d in wdm_outputs
-                        if "voicemeeter" not in d["name"].lower()]
-            self.vr_combo["values"] = vr_names
-            if vr_names:
-                sel = 0
-                for i, name in enumerate(vr_names):
-                    if "steam streaming speakers" in name.lower():
-                        sel = i
-                        break
-                self.vr_combo.current(sel)
+            # (name, lowercased name) pairs, lowercased once
+            mics = [(d["name"], d["name"].lower()) for d in self._vm_inputs
+                    if d["type"] == "wdm"]
+            outs = [(d["name"], d["name"].lower()) for d in vm_outputs
+                    if d["type"] == "wdm"]
+            outs = [e for e in outs if "voicemeeter" not in e[1]]
 
             if SVCL_PATH.exists():
-                self._svcl_devices = query_svcl_devices()
-
-            self._log(f"Found {len(mic_names)} mics, "
-                      f"{len(vr_names)} outputs")
+                self._get_svcl_devices(max_age=SVCL_REFRESH_DEBOUNCE)
 
+            if from_install:
+                self._ui(lambda: self._set_check("devices", True))
+            log(f"Found {len(mics)} mics, {len(outs)} outputs")
+            self._ui(lambda: self._populate_devices(
+                mics, outs, show_configure=from_install))
         except Exception as e:
-            self._log(f"Device detection failed: {e}")
+            if from_install:
+                self._ui(lambda: self._set_check("devices", False))
+            log(f"Device detection failed: {e}")
+        finally:
+            self._detect_lock.release()
+            if not from_install:
+                self._ui(lambda: self._refresh_btn.config(state="normal"))
+
+    def _populate_devices(self, mics: list[tuple[str, str]],
+                          outs: list[tuple[str, str]],
+                          show_configure: bool = False):
+        """Fill the combos from (name, lowercased name) pairs."""
+        self.mic_combo["values"] = [name for name, _ in mics]
+        if mics:
+            sel = next((i for i, (_, nl) in enumerate(mics)
+                        if ("microphone" in nl or "mic" in nl)
+                        and "steam" not in nl), 0)
+            self.mic_combo.current(sel)
+
+        self.vr_combo["values"] = [name for name, _ in outs]
+        if outs:
+            sel = next((i for i, (_, nl) in enumerate(outs)
+                        if "steam streaming speakers" in nl), 0)
+            self.vr_combo.current(sel)
+
+        if show_configure:
+            self._show_phase("configure")
 
     def run(self):
         self.root.mainloop()
@@ -1166,4 +1579,11 @@ class SetupWizard:
 
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    # Elevated helper mode, launched by run_elevated_listen()
+    if len(sys.argv) == 4 and sys.argv[1] == "--apply-listen":
+        try:
+            apply_listen_registry(sys.argv[2], sys.argv[3])
+        except OSError:
+            sys.exit(1)
+        sys.exit(0)
     SetupWizard().run()
@@ -5,7 +5,9 @@ Usage:
     python splash.py "Shutting down..."  # shows custom initial text
 """
 
+import ctypes
 import sys
+import threading
 import tkinter as tk
 from pathlib import Path
 
@@ -13,6 +15,43 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 DONE_SIGNAL = SCRIPT_DIR / "_splash_done"
 STATUS_FILE = SCRIPT_DIR / "_splash_status"
 
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x01
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x10
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+def _start_dir_watcher(root) -> bool:
+    """Fire <<SplashUpdate>> when files in SCRIPT_DIR change.
+
+    Returns False if change notifications aren't available, in which case
+    the caller keeps polling.
+    """
+    try:
+        kernel32 = ctypes.windll.kernel32
+    except AttributeError:
+        return False
+    kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+    handle = kernel32.FindFirstChangeNotificationW(
+        str(SCRIPT_DIR), False,
+        FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE)
+    if not handle or handle == INVALID_HANDLE_VALUE:
+        return False
+    handle = ctypes.c_void_p(handle)
+
+    def _watch():
+        try:
+            while kernel32.WaitForSingleObject(handle, 0xFFFFFFFF) == 0:
+                root.event_generate("<<SplashUpdate>>", when="tail")
+                if not kernel32.FindNextChangeNotification(handle):
+                    break
+        except Exception:
+            pass  # splash already closed
+        finally:
+            kernel32.FindCloseChangeNotification(handle)
+
+    threading.Thread(target=_watch, daemon=True).start()
+    return True
+
 
 def main():
     # Clean stale signals from a previous crash
@@ -46,7 +85,8 @@ def main():
     y = (root.winfo_screenheight() - h) // 2
     root.geometry(f"{w}x{h}+{x}+{y}")
 
-    def poll():
+    def check() -> bool:
+        """Apply signal files. Returns False once the splash is closed."""
         # Check if main process signaled us to close
         if DONE_SIGNAL.exists():
             for f in (DONE_SIGNAL, STATUS_FILE):
@@ -55,7 +95,7 @@ def main():
                 except OSError:
                     pass
             root.destroy()
-            return
+            return False
         # Update status text if main process wrote a new message
         try:
             if STATUS_FILE.exists():
@@ -64,10 +104,18 @@ def main():
                     status_lbl.config(text=text)
         except Exception:
             pass
-        root.after(200, poll)
+        return True
+
+    def poll():
+        if check():
+            root.after(poll_ms, poll)
+
+    # Wake on directory changes; the slow poll is only a safety net
+    root.bind("<<SplashUpdate>>", lambda _e: check())
+    poll_ms = 1000 if _start_dir_watcher(root) else 200
 
     root.after(30000, root.destroy)  # safety net — auto-close after 30s
-    root.after(200, poll)
+    root.after(poll_ms, poll)
     root.mainloop()
 
 
@@ -28,6 +28,10 @@ del "%~dp0switcher.log.1" 2>nul
 del "%~dp0wizard.log" 2>nul
 del "%~dp0wizard.log.1" 2>nul
 del "%~dp0_enum_apps.csv" 2>nul
+del "%~dp0_svcl_cache.json" 2>nul
+del "%~dp0_update_etag.json" 2>nul
+del "%~dp0_vm_path_cache.json" 2>nul
+del "%~dp0vm_runtime.json" 2>nul
 
 echo.
 echo  [OK] Shortcuts and config files removed.
@@ -5,6 +5,8 @@ prompts the user. Uses the GitHub API (no CDN cache delay). Also provides
 a background check that can be called from the tray menu.
 """
 
+import base64
+import functools
 import json
 import logging
 import subprocess
@@ -15,11 +17,14 @@ import urllib.request
 import urllib.error
 from pathlib import Path
 
+from atomic_json import write_json
+
 SCRIPT_DIR = Path(__file__).parent.resolve()
 VERSION_PATH = SCRIPT_DIR / "VERSION"
 REPO = "Aetheriju/vr-audio-switcher"
 API_URL = f"https://api.github.com/repos/{REPO}/contents/VERSION"
 REQUIREMENTS = SCRIPT_DIR / "requirements.txt"
+ETAG_CACHE_PATH = SCRIPT_DIR / "_update_etag.json"
 CHECK_TIMEOUT = 5  # seconds — don't hang startup on slow network
 
 log = logging.getLogger(__name__)
@@ -33,29 +38,95 @@ def local_version() -> str:
         return "0.0.0"
 
 
-def remote_version() -> str | None:
-    """Fetch the latest VERSION from GitHub API. Returns None on failure."""
+_prefetch_thread: threading.Thread | None = None
+_prefetch_result: str | None = None
+
+
+def prefetch_remote_version():
+    """Start fetching the remote VERSION on a background thread.
+
+    Call as early as possible at boot; the next remote_version() call
+    waits for this result instead of making its own request.
+    """
+    global _prefetch_thread
+
+    def _run():
+        global _prefetch_result
+        _prefetch_result = _fetch_remote_version()
+
+    if _prefetch_thread is None:
+        _prefetch_thread = threading.Thread(target=_run, daemon=True)
+        _prefetch_thread.start()
+
+
+def remote_version(timeout: float = CHECK_TIMEOUT) -> str | None:
+    """Fetch the latest VERSION from GitHub API. Returns None on failure.
+
+    If a prefetch is still running after timeout, None is returned and
+    the prefetch is kept, so a later call can still collect it.
+    """
+    global _prefetch_thread
+    if _prefetch_thread is not None:
+        _prefetch_thread.join(timeout)
+        if _prefetch_thread.is_alive():
+            return None
+        _prefetch_thread = None
+        return _prefetch_result
+    return _fetch_remote_version()
+
+
+def remote_check_pending() -> bool:
+    """True while a prefetch started at boot hasn't been collected yet.
+
+    Deliberately not is_alive(): a prefetch that finishes just after
+    remote_version() gave up waiting must still be picked up later.
+    """
+    return _prefetch_thread is not None
+
+
+def _load_etag_cache() -> dict:
     try:
-        req = urllib.request.Request(
-            API_URL,
-            headers={
-                "User-Agent": "vr-audio-switcher",
-                "Accept": "application/vnd.github.v3+json",
-            },
-        )
+        return json.loads(ETAG_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _fetch_remote_version() -> str | None:
+    cached = _load_etag_cache()
+    headers = {
+        "User-Agent": "vr-audio-switcher",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    if cached.get("etag") and cached.get("version"):
+        # 304s are cheaper and don't count against the API rate limit
+        headers["If-None-Match"] = cached["etag"]
+    try:
+        req = urllib.request.Request(API_URL, headers=headers)
         with urllib.request.urlopen(req, timeout=CHECK_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+            data = json.load(resp)
+            etag = resp.headers.get("ETag")
         # GitHub API returns base64-encoded content
         if "content" not in data:
             return None
-        import base64
         content = base64.b64decode(data["content"]).decode("utf-8").strip()
+        if etag:
+            try:
+                write_json(ETAG_CACHE_PATH,
+                           {"etag": etag, "version": content})
+            except OSError:
+                pass
         return content
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return cached["version"]
+        log.debug("Update check failed: %s", e)
+        return None
     except Exception as e:
         log.debug("Update check failed: %s", e)
         return None
 
 
+@functools.lru_cache(maxsize=16)
 def _parse_version(v: str) -> tuple[int, ...]:
     """Parse '1.2.3' into (1, 2, 3) for comparison."""
     try:
@@ -64,89 +135,121 @@ def _parse_version(v: str) -> tuple[int, ...]:
         return (0, 0, 0)
 
 
-def update_available() -> tuple[bool, str, str]:
+def update_available(timeout: float = CHECK_TIMEOUT
+                     ) -> tuple[bool, str, str]:
     """Check if an update is available.
 
     Returns (is_available, local_ver, remote_ver).
     """
     local = local_version()
-    remote = remote_version()
+    remote = remote_version(timeout)
     if remote is None:
         return False, local, ""
     return _parse_version(remote) > _parse_version(local), local, remote
 
 
+def _pip_update() -> str | None:
+    """Upgrade pip packages from requirements.txt. Returns an error or None."""
+    if not REQUIREMENTS.exists():
+        return None
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "-r",
+             str(REQUIREMENTS), "--upgrade", "--quiet"],
+            capture_output=True, text=True, timeout=120,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        if result.returncode == 0:
+            log.info("pip packages updated")
+            return None
+        return f"pip update: {result.stderr[:200]}"
+    except Exception as e:
+        return f"pip error: {e}"
+
+
 def do_update() -> tuple[bool, str]:
     """Pull latest code and update pip packages.
 
     Returns (success, message).
     """
-    errors = []
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Try git pull first (if this is a git repo)
-    git_dir = SCRIPT_DIR / ".git"
-    if git_dir.exists():
-        try:
-            result = subprocess.run(
-                ["git", "pull", "--ff-only"],
-                cwd=str(SCRIPT_DIR),
-                capture_output=True, text=True, timeout=30,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
-            if result.returncode == 0:
-                log.info("git pull: %s", result.stdout.strip())
-            else:
-                errors.append(f"git pull failed: {result.stderr.strip()}")
-        except Exception as e:
-            errors.append(f"git pull error: {e}")
-    else:
-        # Not a git repo — download and extract ZIP
-        try:
-            import zipfile
-            import io
-
-            zip_url = f"https://github.com/{REPO}/archive/refs/heads/main.zip"
-            req = urllib.request.Request(
-                zip_url, headers={"User-Agent": "vr-audio-switcher"})
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                data = resp.read()
-
-            with zipfile.ZipFile(io.BytesIO(data)) as zf:
-                prefix = "vr-audio-switcher-main/"
-                for info in zf.infolist():
-                    if info.is_dir():
-                        continue
-                    rel = info.filename
-                    if rel.startswith(prefix):
-                        rel = rel[len(prefix):]
-                    if not rel:
-                        continue
-                    # Only update code files, not user configs
-                    if rel.endswith((".py", ".bat", ".txt", ".md")) \
-                            or rel in ("VERSION", ".gitignore", "LICENSE"):
+    errors = []
+    pip_future = None
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Try git pull first (if this is a git repo)
+        git_dir = SCRIPT_DIR / ".git"
+        if git_dir.exists():
+            try:
+                result = subprocess.run(
+                    ["git", "pull", "--ff-only"],
+                    cwd=str(SCRIPT_DIR),
+                    capture_output=True, text=True, timeout=30,
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+                if result.returncode == 0:
+                    log.info("git pull: %s", result.stdout.strip())
+                else:
+                    errors.append(
+                        f"git pull failed: {result.stderr.strip()}")
+            except Exception as e:
+                errors.append(f"git pull error: {e}")
+        else:
+            # Not a git repo — download and extract ZIP
+            try:
+                import shutil
+                import tempfile
+                import zipfile
+
+                zip_url = (f"https://github.com/{REPO}"
+                           "/archive/refs/heads/main.zip")
+                req = urllib.request.Request(
+                    zip_url, headers={"User-Agent": "vr-audio-switcher"})
+                # Spool the archive to a temp file rather than RAM
+                archive = tempfile.TemporaryFile()
+                with urllib.request.urlopen(req, timeout=30) as resp:
+                    shutil.copyfileobj(resp, archive, 1 << 20)
+
+                with archive, zipfile.ZipFile(archive) as zf:
+                    prefix = "vr-audio-switcher-main/"
+                    members = []
+                    for info in zf.infolist():
+                        if info.is_dir():
+                            continue
+                        rel = info.filename
+                        if rel.startswith(prefix):
+                            rel = rel[len(prefix):]
+                        if not rel:
+                            continue
+                        # Only update code files, not user configs
+                        if rel.endswith((".py", ".bat", ".ps1", ".txt",
+                                         ".md")) \
+                                or rel in ("VERSION", ".gitignore",
+                                           "LICENSE"):
+                            members.append((info, rel))
+                    # requirements.txt first, so pip can run while the
+                    # rest of the archive is extracted
+                    members.sort(key=lambda m: m[1] != "requirements.txt")
+                    for info, rel in members:
                         dest = SCRIPT_DIR / rel
                         dest.parent.mkdir(parents=True, exist_ok=True)
-                        dest.write_bytes(zf.read(info.filename))
-
-            log.info("Downloaded and extracted latest code from GitHub")
-        except Exception as e:
-            errors.append(f"ZIP download failed: {e}")
-
-    # Update pip packages
-    if REQUIREMENTS.exists():
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r",
-                 str(REQUIREMENTS), "--upgrade", "--quiet"],
-                capture_output=True, text=True, timeout=120,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
-            if result.returncode == 0:
-                log.info("pip packages updated")
-            else:
-                errors.append(f"pip update: {result.stderr[:200]}")
-        except Exception as e:
-            errors.append(f"pip error: {e}")
+                        with zf.open(info) as src, \
+                             open(dest, "wb", buffering=1 << 20) as dst:
+                            shutil.copyfileobj(src, dst, 1 << 20)
+                        if rel == "requirements.txt":
+                            pip_future = pool.submit(_pip_update)
+
+                log.info("Downloaded and extracted latest code from GitHub")
+            except Exception as e:
+                errors.append(f"ZIP download failed: {e}")
+
+        # Update pip packages
+        if pip_future is None:
+            pip_future = pool.submit(_pip_update)
+        pip_error = pip_future.result()
+        if pip_error:
+            errors.append(pip_error)
 
     if errors:
         return False, "; ".join(errors)
@@ -179,38 +282,42 @@ def check_and_prompt() -> bool:
         import tkinter as tk
         from tkinter import messagebox
 
+        # One hidden root for both dialogs; Tk() start-up isn't free
         root = tk.Tk()
         root.withdraw()
+        try:
+            choice = messagebox.askyesnocancel(
+                "VR Audio Switcher \u2014 Update Available",
+                f"A new version is available: v{remote}\n"
+                f"You have: v{local}\n\n"
+                "Yes = Update now (recommended)\n"
+                "No = Skip this time\n"
+                "Cancel = Quit",
+                parent=root,
+            )
 
-        choice = messagebox.askyesnocancel(
-            "VR Audio Switcher \u2014 Update Available",
-            f"A new version is available: v{remote}\n"
-            f"You have: v{local}\n\n"
-            "Yes = Update now (recommended)\n"
-            "No = Skip this time\n"
-            "Cancel = Quit",
-        )
-        root.destroy()
-
-        if choice is None:
-            return False
-        elif choice:
-            ok, msg = do_update()
-            if ok:
-                restart_app()
+            if choice is None:
                 return False
+            elif choice:
+                ok, msg = do_update()
+                if ok:
+                    root.destroy()
+                    root = None
+                    restart_app()
+                    return False
+                else:
+                    messagebox.showwarning(
+                        "Update Failed",
+                        f"Couldn't update automatically:\n{msg}\n\n"
+                        "The app will start with the current version.",
+                        parent=root,
+                    )
+                    return True
             else:
-                root2 = tk.Tk()
-                root2.withdraw()
-                messagebox.showwarning(
-                    "Update Failed",
-                    f"Couldn't update automatically:\n{msg}\n\n"
-                    "The app will start with the current version.",
-                )
-                root2.destroy()
                 return True
-        else:
-            return True
+        finally:
+            if root is not None:
+                root.destroy()
 
     except Exception as e:
         log.warning("Update prompt failed: %s", e)
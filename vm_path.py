@@ -4,9 +4,18 @@ Searches the Windows registry, then falls back to common paths.
 Supports VoiceMeeter Basic, Banana, and Potato.
 """
 
+import functools
+import json
+import subprocess
 import winreg
 from pathlib import Path
 
+from atomic_json import write_json
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+# Located paths, reused across runs while the files are still there
+CACHE_PATH = SCRIPT_DIR / "_vm_path_cache.json"
+
 # Process names for each VoiceMeeter variant (in priority order)
 VM_PROCESS_NAMES = [
     "voicemeeterpro.exe",   # Banana
@@ -14,6 +23,24 @@ VM_PROCESS_NAMES = [
     "voicemeeter8.exe",     # Potato (32-bit)
     "voicemeeter.exe",      # Basic
 ]
+_VM_PROCESS_NAME_SET = frozenset(VM_PROCESS_NAMES)
+
+
+def kill_vm_processes(timeout: float = 5) -> bool:
+    """Force-kill every VoiceMeeter variant with one taskkill call.
+
+    The kernel matches the names, so there's no process scan on our side.
+    Returns False if taskkill couldn't be run (or timed out).
+    """
+    args = ["taskkill.exe", "/F"]
+    for name in VM_PROCESS_NAMES:
+        args += ["/IM", name]
+    try:
+        subprocess.run(args, capture_output=True, timeout=timeout,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+        return True
+    except (OSError, subprocess.TimeoutExpired):
+        return False
 
 # Default install paths (fallback if registry fails)
 _DEFAULT_DIRS = [
@@ -24,13 +51,98 @@ _DEFAULT_DIRS = [
 DLL_NAME = "VoicemeeterRemote64.dll"
 
 
+def _cache_found(fn):
+    """Memoise fn once it finds something. Misses aren't cached, so a
+    VoiceMeeter install made while we're running is still picked up."""
+    cached = functools.lru_cache(maxsize=1)(fn)
+
+    @functools.wraps(fn)
+    def wrapper():
+        result = cached()
+        if result is None:
+            cached.cache_clear()
+        return result
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _load_disk_cache() -> dict:
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _disk_cached(key: str):
+    """Check the on-disk cache before running fn, and record its result."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            cached = _load_disk_cache().get(key)
+            if cached and Path(cached).exists():
+                return Path(cached)
+            result = fn()
+            if result is not None:
+                cache = _load_disk_cache()
+                cache[key] = str(result)
+                try:
+                    write_json(CACHE_PATH, cache)
+                except OSError:
+                    pass
+            return result
+        return wrapper
+    return decorate
+
+
+# Uninstall subkey names VoiceMeeter is known to register, probed directly
+# before falling back to enumerating every installed program
+_KNOWN_UNINSTALL_KEYS = (
+    "VB:Voicemeeter {17359A74-1236-5467}",
+    "VB:Voicemeeter",
+    "VB:VoicemeeterBanana",
+    "VB:VoicemeeterPotato",
+)
+
+_UNINSTALL_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+
+
+def _dir_from_uninstall_key(key) -> Path | None:
+    """Return the install dir if this Uninstall subkey points at VoiceMeeter."""
+    try:
+        loc, _ = winreg.QueryValueEx(key, "UninstallString")
+    except OSError:
+        return None
+    # UninstallString is like
+    # "C:\Program Files (x86)\VB\Voicemeeter\uninst..."
+    p = Path(loc).parent
+    if (p / DLL_NAME).exists():
+        return p
+    return None
+
+
+@_cache_found
 def _find_from_registry() -> Path | None:
     """Try to find VoiceMeeter install dir from the Windows registry."""
+    hives = (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER)
+
+    # Fast path: open the known subkeys by name
+    for hive in hives:
+        for name in _KNOWN_UNINSTALL_KEYS:
+            try:
+                with winreg.OpenKey(hive, rf"{_UNINSTALL_KEY}\{name}") as key:
+                    p = _dir_from_uninstall_key(key)
+                    if p:
+                        return p
+            except OSError:
+                continue
+
     # VoiceMeeter registers its install path under Uninstall keys
-    uninstall_key = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
-    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+    for hive in hives:
         try:
-            with winreg.OpenKey(hive, uninstall_key) as key:
+            with winreg.OpenKey(hive, _UNINSTALL_KEY) as key:
                 i = 0
                 while True:
                     try:
@@ -40,16 +152,9 @@ def _find_from_registry() -> Path | None:
                                 and "VB:" not in subkey_name:
                             continue
                         with winreg.OpenKey(key, subkey_name) as subkey:
-                            try:
-                                loc, _ = winreg.QueryValueEx(
-                                    subkey, "UninstallString")
-                                # UninstallString is like
-                                # "C:\Program Files (x86)\VB\Voicemeeter\uninst..."
-                                p = Path(loc).parent
-                                if (p / DLL_NAME).exists():
-                                    return p
-                            except OSError:
-                                pass
+                            p = _dir_from_uninstall_key(subkey)
+                            if p:
+                                return p
                     except OSError:
                         break
         except OSError:
@@ -57,6 +162,8 @@ def _find_from_registry() -> Path | None:
     return None
 
 
+@_cache_found
+@_disk_cached("dll")
 def find_dll() -> Path | None:
     """Find VoicemeeterRemote64.dll."""
     # Try registry first
@@ -75,6 +182,8 @@ def find_dll() -> Path | None:
     return None
 
 
+@_cache_found
+@_disk_cached("exe")
 def find_exe() -> Path | None:
     """Find the VoiceMeeter executable (Banana > Potato > Basic)."""
     # Try registry first
@@ -94,4 +203,14 @@ def is_vm_process(process_name: str) -> bool:
     """Check if a process name is any VoiceMeeter variant."""
     if not process_name:
         return False
-    return process_name.lower() in VM_PROCESS_NAMES
+    return process_name.lower() in _VM_PROCESS_NAME_SET
+
+
+def clear_cache():
+    """Forget cached install paths (e.g. after VoiceMeeter is reinstalled)."""
+    for fn in (_find_from_registry, find_dll, find_exe):
+        fn.cache_clear()
+    try:
+        CACHE_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
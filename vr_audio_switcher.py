@@ -7,6 +7,7 @@ the user closes the UI), shuts everything down and goes back to watching.
 
 import csv
 import ctypes
+import ctypes.wintypes as wintypes
 import json
 import logging
 import logging.handlers
@@ -15,32 +16,125 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
 
 import psutil
 
+import win_proc_names
+from atomic_json import write_json
+from vm_path import (VM_PROCESS_NAMES, find_dll, find_exe, is_vm_process,
+                     kill_vm_processes)
+
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CONFIG_PATH = SCRIPT_DIR / "config.json"
 LOG_PATH = SCRIPT_DIR / "switcher.log"
 MUTEX_NAME = "Global\\VRAudioSwitcherMutex"
 STATE_PATH = SCRIPT_DIR / "state.json"
 VM_DEVICES_PATH = SCRIPT_DIR / "vm_devices.json"
+VM_RUNTIME_PATH = SCRIPT_DIR / "vm_runtime.json"  # last VoiceMeeter PID
 
 ENFORCE_INTERVAL = 5  # seconds between enforcement cycles
+ENFORCE_FULL_EVERY = 4  # re-apply svcl routing every Nth cycle regardless
+LOG_FLUSH_EVERY = 6  # enforce cycles between log flushes (~30s)
+AUDIO_APPS_MAX_AGE = 60  # seconds an unchanged svcl app list is trusted
+APPLY_DEBOUNCE = 0.25  # seconds; user-triggered applies within this merge
+BOOT_UPDATE_WAIT = 2  # seconds the boot update check may hold up startup
 SPLASH_DONE = SCRIPT_DIR / "_splash_done"
 SPLASH_STATUS = SCRIPT_DIR / "_splash_status"
-SHOW_UI_SIGNAL = SCRIPT_DIR / "_show_ui"
+SHOW_UI_SIGNAL = SCRIPT_DIR / "_show_ui"  # fallback if the event fails
+SHOW_UI_EVENT = "Local\\VRAudioSwitcherShowUI"
+
+# VoiceMeeter mixer values used when there's no vm_state.json yet
+VM_DEFAULTS = {
+    "Strip[3].Gain": 0.0, "Bus[3].Gain": 0.0, "Bus[4].Gain": 0.0,
+    "Strip[0].Gain": 0.0,
+    "Strip[3].eqgain1": 0.0, "Strip[3].eqgain2": 0.0,
+    "Strip[3].eqgain3": 0.0,
+}
+# Routing the switcher depends on: mic -> B1, music -> B2, neither -> A1
+VM_ROUTING = {
+    "Strip[0].B1": 1.0, "Strip[3].B2": 1.0,
+    "Strip[0].A1": 0.0, "Strip[3].A1": 0.0,
+}
+# Names we always use, encoded once up front (Potato has up to 8 strips)
+_VM_PARAM_BYTES = {name: name.encode("ascii")
+                   for name in (*VM_DEFAULTS, *VM_ROUTING)}
+_STRIP_B1_BYTES = tuple(f"Strip[{i}].B1".encode("ascii") for i in range(8))
 
 
 def _splash_update(text):
     """Update the loading splash status text."""
+    # Write-then-rename so the splash never reads a half-written file
+    tmp = SPLASH_STATUS.with_suffix(".tmp")
     try:
-        SPLASH_STATUS.write_text(text, encoding="utf-8")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, SPLASH_STATUS)
     except OSError:
         pass
 
 
+def _wait_until(pred, timeout: float, interval: float = 0.05) -> bool:
+    """Poll pred() until it's true or timeout passes. Returns pred's state."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if pred():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def _float_params(params: dict) -> dict[str, float]:
+    """Cast VM param values to float, dropping (and logging) bad ones."""
+    valid = {}
+    for param, value in params.items():
+        try:
+            valid[param] = float(value)
+        except (ValueError, TypeError):
+            logging.warning("Skipping invalid VM param %s=%s", param, value)
+    return valid
+
+
+def _csv_columns(text: str, *columns: str):
+    """Yield stripped tuples of the named columns from svcl CSV text.
+
+    Column positions come from the header once; rows are plain lists, so
+    there's no per-row dict as with csv.DictReader.
+    """
+    rows = csv.reader(text.splitlines())
+    header = [h.strip() for h in next(rows, [])]
+    try:
+        idx = [header.index(c) for c in columns]
+    except ValueError:
+        return
+    width = max(idx)
+    for row in rows:
+        if len(row) > width:
+            yield tuple(row[i].strip() for i in idx)
+
+
+def _flush_logs():
+    """Push buffered log records to disk (session boundaries, idle waits
+    and every LOG_FLUSH_EVERY enforce cycles)."""
+    for handler in logging.getLogger().handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+def _msgbox(text: str, error: bool = False):
+    """Native message box; no Tk needed on the early exit paths."""
+    try:
+        ctypes.windll.user32.MessageBoxW(
+            0, text, "VR Audio Switcher",
+            0x10 if error else 0x40)  # MB_ICONERROR / MB_ICONINFORMATION
+    except (AttributeError, OSError):
+        print(text, file=sys.stderr)
+
+
 # ---------------------------------------------------------------------------
 # Single-instance lock
 # ---------------------------------------------------------------------------
@@ -52,6 +146,23 @@ def acquire_single_instance():
     return mutex
 
 
+def signal_show_ui():
+    """Ask the running instance to show its window."""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.OpenEventW.restype = wintypes.HANDLE
+    handle = kernel32.OpenEventW(0x0002, False, SHOW_UI_EVENT)  # MODIFY_STATE
+    if handle:
+        try:
+            if kernel32.SetEvent(wintypes.HANDLE(handle)):
+                return
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(handle))
+    try:
+        SHOW_UI_SIGNAL.touch()
+    except OSError:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # User mode: what the user has selected
 # ---------------------------------------------------------------------------
@@ -71,15 +182,65 @@ class AudioOutput(Enum):
 MODE_CYCLE = [UserMode.DESKTOP, UserMode.SILENT_VR, UserMode.VR]
 
 
+# Lowercased names of running processes, shared by every caller within
+# the TTL so the detector and the enforce loop don't each walk the list
+_proc_name_cache: tuple[float, frozenset[str]] | None = None
+
+
+def _snapshot_proc_names(ttl: float = 1.0) -> frozenset[str]:
+    global _proc_name_cache
+    cached = _proc_name_cache
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    names = None
+    try:
+        names = win_proc_names.enum_names()
+    except Exception:
+        pass
+    if names is None:
+        names = frozenset((p.info["name"] or "").lower()
+                          for p in psutil.process_iter(["name"]))
+    _proc_name_cache = (time.monotonic(), names)
+    return names
+
+
 def is_process_running(name: str) -> bool:
-    name_lower = name.lower()
-    for proc in psutil.process_iter(["name"]):
-        try:
-            if proc.info["name"] and proc.info["name"].lower() == name_lower:
-                return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    return False
+    return name.lower() in _snapshot_proc_names()
+
+
+def _vm_pid() -> int:
+    """PID of a running VoiceMeeter (0 if none), stopping at first match."""
+    try:
+        pid = win_proc_names.find_pid(is_vm_process)
+    except Exception:
+        pid = None
+    if pid is None:
+        pid = next((p.pid for p in psutil.process_iter(["name"])
+                    if is_vm_process(p.info["name"] or "")), 0)
+    return pid
+
+
+def _recorded_vm_pid() -> int:
+    """PID from vm_runtime.json if it's still a VoiceMeeter process, else 0.
+
+    One OpenProcess for the recorded PID instead of a process walk.
+    """
+    try:
+        with open(VM_RUNTIME_PATH) as f:
+            pid = int(json.load(f)["vm_pid"])
+        if is_vm_process(psutil.Process(pid).name()):
+            return pid
+    except (OSError, ValueError, KeyError, TypeError, psutil.Error):
+        pass
+    return 0
+
+
+def _record_vm_pid(pid: int, exe: Path | None = None):
+    try:
+        write_json(VM_RUNTIME_PATH,
+                    {"vm_pid": pid, "vm_exe": str(exe) if exe else None})
+    except OSError:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -91,18 +252,33 @@ class VoiceMeeterRemote:
     def __init__(self):
         self._dll = None
         self._logged_in = False
+        # Hot entry points, bound once per DLL load (see _bind)
+        self._set_f = self._get_f = self._set_s = self._get_s = None
+        # Encoded parameter names, and one reusable buffer for string reads
+        # (guarded by a lock: the mixer and enforce threads both read)
+        self._param_bytes: dict[str, bytes] = dict(_VM_PARAM_BYTES)
+        self._str_buf = ctypes.create_string_buffer(512)
+        self._str_lock = threading.Lock()
+
+    def _pb(self, param: str) -> bytes:
+        pb = self._param_bytes.get(param)
+        if pb is None:
+            pb = self._param_bytes[param] = param.encode("ascii")
+        return pb
 
     def _ensure_connected(self) -> bool:
         if self._logged_in:
             return True
         try:
             if self._dll is None:
-                from vm_path import find_dll
                 dll_path = find_dll()
                 if not dll_path:
                     logging.error("VoiceMeeter DLL not found")
                     return False
-                self._dll = ctypes.WinDLL(str(dll_path))
+                dll = ctypes.WinDLL(str(dll_path))
+                self._declare_prototypes(dll)
+                self._bind(dll)
+                self._dll = dll
             ret = self._dll.VBVMR_Login()
             # 0 = OK, 1 = OK but VoiceMeeter not running (launched it)
             if ret in (0, 1):
@@ -115,6 +291,46 @@ class VoiceMeeterRemote:
             logging.exception("VoiceMeeter connect failed")
             return False
 
+    @staticmethod
+    def _declare_prototypes(dll):
+        """Declare signatures so ctypes skips per-call argument guessing."""
+        c_long, c_char_p = ctypes.c_long, ctypes.c_char_p
+        protos = {
+            "VBVMR_Login": [],
+            "VBVMR_Logout": [],
+            "VBVMR_IsParametersDirty": [],
+            "VBVMR_GetParameterFloat": [c_char_p,
+                                        ctypes.POINTER(ctypes.c_float)],
+            "VBVMR_SetParameterFloat": [c_char_p, ctypes.c_float],
+            "VBVMR_GetParameterStringA": [c_char_p, c_char_p],
+            "VBVMR_SetParameterStringA": [c_char_p, c_char_p],
+            "VBVMR_SetParameters": [c_char_p],
+            "VBVMR_GetVoicemeeterType": [ctypes.POINTER(c_long)],
+        }
+        for name, argtypes in protos.items():
+            fn = getattr(dll, name)
+            fn.argtypes = argtypes
+            fn.restype = c_long
+
+    def _bind(self, dll):
+        """Keep the per-call functions as plain attributes, skipping the
+        DLL attribute lookup on every get/set."""
+        self._set_f = dll.VBVMR_SetParameterFloat
+        self._get_f = dll.VBVMR_GetParameterFloat
+        self._set_s = dll.VBVMR_SetParameterStringA
+        self._get_s = dll.VBVMR_GetParameterStringA
+
+    def is_running(self) -> bool:
+        """True once the VoiceMeeter engine is up and answering the API."""
+        if not self._ensure_connected():
+            return False
+        try:
+            vm_type = ctypes.c_long()
+            return self._dll.VBVMR_GetVoicemeeterType(
+                ctypes.byref(vm_type)) == 0
+        except Exception:
+            return False
+
     def get(self, param: str) -> float:
         """Get a float parameter (used by mixer sliders)."""
         if not self._ensure_connected():
@@ -122,8 +338,7 @@ class VoiceMeeterRemote:
         try:
             self._dll.VBVMR_IsParametersDirty()
             buf = ctypes.c_float()
-            ret = self._dll.VBVMR_GetParameterFloat(
-                param.encode("ascii"), ctypes.byref(buf))
+            ret = self._get_f(self._pb(param), ctypes.byref(buf))
             if ret != 0:
                 return 0.0
             return round(buf.value, 1)
@@ -140,10 +355,13 @@ class VoiceMeeterRemote:
         """Set Strip[N].B1 on/off. Returns True on success."""
         if not self._ensure_connected():
             return False
-        param = f"Strip[{strip}].B1".encode("ascii")
-        value = ctypes.c_float(1.0 if enabled else 0.0)
+        if 0 <= strip < len(_STRIP_B1_BYTES):
+            param = _STRIP_B1_BYTES[strip]
+        else:
+            param = self._pb(f"Strip[{strip}].B1")
         try:
-            ret = self._dll.VBVMR_SetParameterFloat(param, value)
+            # argtypes are declared, so ctypes boxes the float itself
+            ret = self._set_f(param, 1.0 if enabled else 0.0)
             if ret == 0:
                 return True
             logging.warning("VoiceMeeter SetParameterFloat returned %d", ret)
@@ -158,8 +376,7 @@ class VoiceMeeterRemote:
         if not self._ensure_connected():
             return False
         try:
-            ret = self._dll.VBVMR_SetParameterFloat(
-                param.encode("ascii"), ctypes.c_float(value))
+            ret = self._set_f(self._pb(param), value)
             return ret == 0
         except Exception:
             logging.exception("VoiceMeeter set_param(%s) failed", param)
@@ -171,11 +388,13 @@ class VoiceMeeterRemote:
         if not self._ensure_connected():
             return None
         try:
-            buf = ctypes.create_string_buffer(512)
-            ret = self._dll.VBVMR_GetParameterStringA(
-                param.encode("ascii"), buf)
+            with self._str_lock:
+                buf = self._str_buf
+                buf[0] = b"\0"
+                ret = self._get_s(self._pb(param), buf)
+                raw = buf.value
             if ret == 0:
-                val = buf.value.decode("utf-8", errors="replace").strip()
+                val = raw.decode("utf-8", errors="replace").strip()
                 return val if val else None
             return None
         except Exception:
@@ -183,13 +402,37 @@ class VoiceMeeterRemote:
             self._logged_in = False
             return None
 
+    def get_string_params(self, params: list[str]) -> dict[str, str]:
+        """Read several string parameters; empty/failed ones are omitted.
+
+        The Remote API has no batch read, so this is one login check, one
+        lock and one shared buffer for the whole set.
+        """
+        if not self._ensure_connected():
+            return {}
+        fn = self._get_s
+        result = {}
+        try:
+            with self._str_lock:
+                buf = self._str_buf
+                for param in params:
+                    buf[0] = b"\0"
+                    if fn(self._pb(param), buf) == 0:
+                        val = buf.value.decode("utf-8",
+                                               errors="replace").strip()
+                        if val:
+                            result[param] = val
+        except Exception:
+            logging.exception("get_string_params failed")
+            self._logged_in = False
+        return result
+
     def set_string_param(self, param: str, value: str) -> bool:
         """Set a string parameter (e.g. Strip[0].device.wdm)."""
         if not self._ensure_connected():
             return False
         try:
-            ret = self._dll.VBVMR_SetParameterStringA(
-                param.encode("ascii"), value.encode("utf-8"))
+            ret = self._set_s(self._pb(param), value.encode("utf-8"))
             if ret == 0:
                 return True
             logging.warning("set_string_param(%s) returned %d", param, ret)
@@ -199,13 +442,48 @@ class VoiceMeeterRemote:
             self._logged_in = False
             return False
 
+    def set_params_bulk(self, params: dict) -> bool:
+        """Apply many parameters in one VBVMR_SetParameters script.
+
+        Float values are written as numbers, str values quoted. The script
+        has no escape for '"', so strings containing one are sent through
+        set_string_param() instead. Returns False if anything was
+        rejected, so callers can retry one by one.
+        """
+        if not params:
+            return True
+        if not self._ensure_connected():
+            return False
+        lines = []
+        ok = True
+        for key, value in params.items():
+            if isinstance(value, str):
+                if '"' in value:
+                    ok = self.set_string_param(key, value) and ok
+                else:
+                    lines.append(f'{key}="{value}";')
+            else:
+                lines.append(f"{key}={float(value)};")
+        if not lines:
+            return ok
+        try:
+            ret = self._dll.VBVMR_SetParameters(
+                "\n".join(lines).encode("utf-8"))
+            if ret == 0:
+                return ok
+            logging.warning("VoiceMeeter SetParameters returned %d", ret)
+            return False
+        except Exception:
+            logging.exception("VoiceMeeter set_params_bulk failed")
+            self._logged_in = False
+            return False
+
     def shutdown(self):
         """Gracefully shut down VoiceMeeter via API (lets it save settings)."""
         if not self._ensure_connected():
             return
         try:
-            self._dll.VBVMR_SetParameterFloat(
-                b"Command.Shutdown", ctypes.c_float(1.0))
+            self._set_f(b"Command.Shutdown", 1.0)
             logging.info("VoiceMeeter shutdown command sent")
         except Exception:
             logging.exception("VoiceMeeter shutdown failed")
@@ -224,12 +502,12 @@ class VoiceMeeterRemote:
 # ---------------------------------------------------------------------------
 class AudioSwitcher:
     # System processes that should never have their audio switched
-    SYSTEM_EXCLUDE = {
+    SYSTEM_EXCLUDE = frozenset({
         "vrchat.exe", "vrserver.exe", "vrmonitor.exe", "vrwebhelper.exe",
         "steamwebhelper.exe", "voicemeeterpro.exe", "voicemeeter.exe",
         "voicemeeter8.exe", "voicemeeter8x64.exe", "svchost.exe",
         "rundll32.exe", "audiodg.exe", "dwm.exe",
-    }
+    })
 
     # VR headset audio device name patterns (matched case-insensitive)
     VR_HEADSET_PATTERNS = {
@@ -243,8 +521,7 @@ class AudioSwitcher:
         self._multi_target = "exclude_processes" in config
 
         if self._multi_target:
-            self._user_exclude = {
-                p.lower() for p in config["exclude_processes"]}
+            self.user_exclude = config["exclude_processes"]
         else:
             # Legacy single-target mode (old config with target_process)
             self._target = config.get("target_process", "chrome.exe")
@@ -252,34 +529,46 @@ class AudioSwitcher:
         if not Path(self.svcl_path).exists():
             raise FileNotFoundError(f"svcl.exe not found at {self.svcl_path}")
 
+        self._executor = ThreadPoolExecutor(max_workers=8,
+                                            thread_name_prefix="svcl")
+        # (monotonic ts, running process names, audio apps) of the last
+        # svcl enumeration
+        self._apps_cache = None
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def user_exclude(self) -> frozenset[str]:
+        return self._user_exclude
+
+    @user_exclude.setter
+    def user_exclude(self, names):
+        # Keep the combined set prebuilt; it's consulted every enforce pass
+        self._user_exclude = frozenset(p.lower() for p in names)
+        self._exclude = self._user_exclude | self.SYSTEM_EXCLUDE
+
     def _enumerate_audio_apps(self) -> set[str]:
         """Query svcl for all processes with active render audio sessions."""
-        tmp = SCRIPT_DIR / "_enum_apps.csv"
         try:
-            subprocess.run(
-                [self.svcl_path, "/scomma", str(tmp),
+            # An empty /scomma filename makes svcl write the CSV to stdout
+            result = subprocess.run(
+                [self.svcl_path, "/scomma", "",
                  "/Columns", "Name,Type,Direction,Process Path"],
                 capture_output=True, timeout=10,
                 creationflags=subprocess.CREATE_NO_WINDOW,
             )
+            text = result.stdout.decode("utf-8-sig", errors="replace")
             processes = set()
-            with open(tmp, newline="",
-                      encoding="utf-8-sig", errors="replace") as f:
-                for row in csv.DictReader(f):
-                    if (row.get("Type", "").strip() == "Application"
-                            and row.get("Direction", "").strip() == "Render"):
-                        proc_path = row.get("Process Path", "").strip()
-                        if proc_path:
-                            processes.add(Path(proc_path).name.lower())
+            for kind, direction, proc_path in _csv_columns(
+                    text, "Type", "Direction", "Process Path"):
+                if (kind == "Application" and direction == "Render"
+                        and proc_path):
+                    processes.add(Path(proc_path).name.lower())
             return processes
         except Exception:
             logging.debug("Audio app enumeration failed", exc_info=True)
             return set()
-        finally:
-            try:
-                tmp.unlink(missing_ok=True)
-            except OSError:
-                pass
 
     # Patterns that indicate a real speaker/soundbar/headphone (high priority)
     SPEAKER_PATTERNS = {
@@ -295,90 +584,131 @@ class AudioSwitcher:
 
     def _find_desktop_device(self) -> str:
         """Find the best non-headset render device for Desktop mode."""
-        tmp = SCRIPT_DIR / "_enum_devices.csv"
         try:
-            subprocess.run(
-                [self.svcl_path, "/scomma", str(tmp),
+            # CSV straight from stdout, as in _enumerate_audio_apps
+            result = subprocess.run(
+                [self.svcl_path, "/scomma", "",
                  "/Columns", "Name,Type,Direction,Device State,"
                  "Command-Line Friendly ID"],
                 capture_output=True, timeout=10,
                 creationflags=subprocess.CREATE_NO_WINDOW,
             )
+            text = result.stdout.decode("utf-8-sig", errors="replace")
             speakers = []       # real speakers/soundbars (tier 1)
             other = []          # unknown devices (tier 2)
             display_audio = []  # monitor audio outputs (tier 3)
-            with open(tmp, newline="",
-                      encoding="utf-8-sig", errors="replace") as f:
-                for row in csv.DictReader(f):
-                    if (row.get("Type", "").strip() != "Device"
-                            or row.get("Direction", "").strip() != "Render"
-                            or row.get("Device State", "").strip() != "Active"):
-                        continue
-                    name = row.get("Name", "").strip()
-                    fid = row.get("Command-Line Friendly ID", "").strip()
-                    if not fid:
-                        continue
-                    name_lower = name.lower()
-                    fid_lower = fid.lower()
-                    # Skip VoiceMeeter virtual devices
-                    if "voicemeeter" in name_lower or "vb-audio" in fid_lower:
-                        continue
-                    # Skip VR headset devices entirely
-                    combined = name_lower + " " + fid_lower
-                    if any(p in combined for p in self.VR_HEADSET_PATTERNS):
-                        continue
-                    # Classify remaining devices by priority
-                    if any(p in combined
-                           for p in self.SPEAKER_PATTERNS):
-                        speakers.append(fid)
-                    elif any(p in combined
-                             for p in self.DISPLAY_AUDIO_PATTERNS):
-                        display_audio.append(fid)
-                    else:
-                        other.append(fid)
+            for name, kind, direction, state, fid in _csv_columns(
+                    text, "Name", "Type", "Direction", "Device State",
+                    "Command-Line Friendly ID"):
+                if (kind != "Device" or direction != "Render"
+                        or state != "Active" or not fid):
+                    continue
+                name_lower = name.lower()
+                fid_lower = fid.lower()
+                # Skip VoiceMeeter virtual devices
+                if "voicemeeter" in name_lower or "vb-audio" in fid_lower:
+                    continue
+                # Skip VR headset devices entirely
+                combined = name_lower + " " + fid_lower
+                if any(p in combined for p in self.VR_HEADSET_PATTERNS):
+                    continue
+                # Classify remaining devices by priority
+                if any(p in combined
+                       for p in self.SPEAKER_PATTERNS):
+                    speakers.append(fid)
+                elif any(p in combined
+                         for p in self.DISPLAY_AUDIO_PATTERNS):
+                    display_audio.append(fid)
+                else:
+                    other.append(fid)
             # Pick best available in priority order
             for tier in (speakers, other, display_audio):
                 if tier:
-                    logging.debug("Desktop device selected: %s (from %d candidates)",
-                                  tier[0][:40], len(tier))
+                    if logging.root.isEnabledFor(logging.DEBUG):
+                        logging.debug("Desktop device selected: %s (from %d candidates)",
+                                      tier[0][:40], len(tier))
                     return tier[0]
             return "DefaultRenderDevice"
         except Exception:
             logging.debug("Desktop device enumeration failed", exc_info=True)
             return "DefaultRenderDevice"
-        finally:
-            try:
-                tmp.unlink(missing_ok=True)
-            except OSError:
-                pass
+
+    @staticmethod
+    def _svcl_matched(out: bytes) -> bool:
+        return b"1 item" in out or b"items found" in out
 
     def _svcl_set(self, device: str, process: str) -> bool:
         """Run svcl /SetAppDefault for a single process."""
         cmd = [self.svcl_path, "/Stdout",
                "/SetAppDefault", device, "all", process]
         try:
+            # Only stdout is inspected; raw bytes, no stderr pipe
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                timeout=10, creationflags=subprocess.CREATE_NO_WINDOW,
             )
-            stdout = result.stdout.strip()
-            return "1 item" in stdout or "items found" in stdout
+            return self._svcl_matched(result.stdout)
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
+    def _svcl_set_many(self, device: str,
+                       processes: list[str]) -> int | None:
+        """Chain one /SetAppDefault per process into a single svcl run.
+
+        Returns how many matched, or None if svcl didn't report one result
+        line per command (older builds only run the first command).
+        """
+        cmd = [self.svcl_path, "/Stdout"]
+        for proc in processes:
+            cmd += ["/SetAppDefault", device, "all", proc]
+        try:
+            result = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                timeout=max(10, 2 * len(processes)),
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        lines = [ln for ln in result.stdout.splitlines() if b"item" in ln]
+        if len(lines) != len(processes):
+            return None
+        return sum(map(self._svcl_matched, lines))
+
     def set_system_default(self, device: str):
         """Set the Windows system default render device via svcl."""
         try:
             subprocess.run(
                 [self.svcl_path, "/SetDefault", device, "all"],
-                capture_output=True, timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=10, creationflags=subprocess.CREATE_NO_WINDOW,
             )
         except Exception:
             logging.debug("Failed to set system default device", exc_info=True)
 
-    def switch_to(self, output: AudioOutput) -> bool:
-        """Set audio output for target app(s). Returns True if any succeeded."""
+    def audio_targets(self, fresh: bool = True) -> frozenset[str] | None:
+        """Non-excluded processes with audio sessions (None in legacy mode).
+
+        With fresh=False the last svcl result is reused while no process
+        has started or exited since, for up to AUDIO_APPS_MAX_AGE seconds.
+        """
+        if not self._multi_target:
+            return None
+        running = _snapshot_proc_names()
+        cached = self._apps_cache
+        if (not fresh and cached and cached[1] == running
+                and time.monotonic() - cached[0] < AUDIO_APPS_MAX_AGE):
+            apps = cached[2]
+        else:
+            apps = self._enumerate_audio_apps()
+            self._apps_cache = (time.monotonic(), running, apps)
+        return frozenset(apps - self._exclude)
+
+    def switch_to(self, output: AudioOutput,
+                  targets: frozenset[str] | None = None) -> bool:
+        """Set audio output for target app(s). Returns True if any succeeded.
+
+        Pass targets from audio_targets() to skip enumerating again.
+        """
         device = self.vr_device if output == AudioOutput.VR \
             else self._find_desktop_device()
 
@@ -388,20 +718,24 @@ class AudioSwitcher:
                 return False
             return self._svcl_set(device, self._target)
 
-        # Multi-target: enumerate and switch all non-excluded audio apps
-        apps = self._enumerate_audio_apps()
-        exclude = self.SYSTEM_EXCLUDE | self._user_exclude
-        targets = [p for p in apps if p not in exclude]
+        # Multi-target: switch all non-excluded audio apps
+        if targets is None:
+            targets = self.audio_targets()
 
         if not targets:
             return False
 
-        ok_count = 0
-        for proc in targets:
-            if self._svcl_set(device, proc):
-                ok_count += 1
-        logging.debug("Switched %d/%d audio apps to %s",
-                      ok_count, len(targets), device[:30])
+        ok_count = None
+        if len(targets) > 1:
+            ok_count = self._svcl_set_many(device, sorted(targets))
+        if ok_count is None:
+            # One svcl launch per app; run them side by side
+            futures = [self._executor.submit(self._svcl_set, device, proc)
+                       for proc in targets]
+            ok_count = sum(f.result() for f in futures)
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("Switched %d/%d audio apps to %s",
+                          ok_count, len(targets), device[:30])
         return ok_count > 0
 
 
@@ -420,6 +754,8 @@ class VRDetector:
         self._thread = None
         self._vr_running = None
         self._last_change = 0.0
+        self._vr_handle = 0  # open handle to the VR process once found
+        self._handle_lock = threading.Lock()
 
     def start(self):
         self._stop.clear()
@@ -430,9 +766,33 @@ class VRDetector:
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=10)
-
-    def is_vr_running(self) -> bool:
-        return is_process_running(self.process_name)
+        with self._handle_lock:
+            if self._vr_handle:
+                win_proc_names.close_handle(self._vr_handle)
+                self._vr_handle = 0
+
+    def is_vr_running(self, cached: bool = False) -> bool:
+        """cached=True answers from the shared ~1s process snapshot; fine
+        for display, while the poll loop always takes a fresh look."""
+        if cached:
+            return is_process_running(self.process_name)
+        with self._handle_lock:
+            # Once found, probe that one process instead of walking them all
+            if self._vr_handle:
+                if win_proc_names.handle_alive(self._vr_handle):
+                    return True
+                win_proc_names.close_handle(self._vr_handle)
+                self._vr_handle = 0
+            try:
+                pid = win_proc_names.find_pid(
+                    lambda n: n.lower() == self.process_name)
+            except Exception:
+                pid = None
+            if pid is None:
+                return is_process_running(self.process_name)
+            if pid:
+                self._vr_handle = win_proc_names.open_process(pid)
+            return bool(pid)
 
     def _poll(self):
         while not self._stop.is_set():
@@ -464,6 +824,14 @@ class VRAudioSwitcher:
         self._current_output = None
         self._mic_enabled = True  # Strip[3].B1 state
         self._confirmed = False   # True when svcl matched at least one app
+        # (output, targets) of the last successful switch, and the enforce
+        # cycle count, so steady-state passes can skip svcl
+        self._last_applied = None
+        self._enforce_tick = 0
+        self._state_cache = None  # last state.json contents we wrote
+        self._config_mtime = None  # config.json mtime at last reload
+        self._apply_pending = threading.Event()
+        self._apply_thread = None
         self._stop = threading.Event()
         self._lock = threading.Lock()
         self._vm_ready = threading.Event()
@@ -471,33 +839,31 @@ class VRAudioSwitcher:
         self._session_active = False
         self._in_cleanup = False
         self._vr_start_event = threading.Event()
+        self._show_ui_requested = threading.Event()
+        self._wake = threading.Event()  # set on VR start or show-UI request
         self._user_quit = False
         self._vm_dialog_shown = False
+        self._vm_proc = None  # VoiceMeeter Popen, if we launched it
+        self.pending_update: str | None = None  # remote version, if any
         self.ui = None
 
     @staticmethod
     def _minimize_voicemeeter():
         """Hide VoiceMeeter's window so only our UI is visible."""
-        from vm_path import is_vm_process
         user32 = ctypes.windll.user32
         SW_MINIMIZE = 6
-        for proc in psutil.process_iter(["name", "pid"]):
-            try:
-                if not is_vm_process(proc.info.get("name", "")):
-                    continue
-                pid = proc.info["pid"]
-                WNDENUMPROC = ctypes.WINFUNCTYPE(
-                    ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
-                def _enum_cb(hwnd, _lp):
-                    tid_pid = ctypes.c_ulong()
-                    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(tid_pid))
-                    if tid_pid.value == pid and user32.IsWindowVisible(hwnd):
-                        user32.ShowWindow(hwnd, SW_MINIMIZE)
-                    return True
-                user32.EnumWindows(WNDENUMPROC(_enum_cb), 0)
-                break
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        pid = _vm_pid()
+        if not pid:
+            return
+        WNDENUMPROC = ctypes.WINFUNCTYPE(
+            ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+        def _enum_cb(hwnd, _lp):
+            tid_pid = ctypes.c_ulong()
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(tid_pid))
+            if tid_pid.value == pid and user32.IsWindowVisible(hwnd):
+                user32.ShowWindow(hwnd, SW_MINIMIZE)
+            return True
+        user32.EnumWindows(WNDENUMPROC(_enum_cb), 0)
 
     def _init_voicemeeter(self):
         """Connect to VoiceMeeter and restore device/param settings."""
@@ -506,24 +872,24 @@ class VRAudioSwitcher:
             try:
                 with open(VM_DEVICES_PATH) as f:
                     devs = json.load(f)
-                for key, name in devs.items():
-                    ok = self.vm.set_string_param(f"{key}.device.wdm", name)
-                    logging.info("Set %s.device.wdm = %s (%s)", key, name,
-                                 "OK" if ok else "FAIL")
+                if self.vm.set_params_bulk(
+                        {f"{key}.device.wdm": name
+                         for key, name in devs.items()}):
+                    logging.info("Restored %d device assignments", len(devs))
+                else:
+                    for key, name in devs.items():
+                        ok = self.vm.set_string_param(f"{key}.device.wdm",
+                                                      name)
+                        logging.info("Set %s.device.wdm = %s (%s)", key,
+                                     name, "OK" if ok else "FAIL")
                 if devs:
                     time.sleep(1)
             except Exception:
                 logging.exception("Failed to restore device assignments")
 
         # Restore mixer settings
-        VM_DEFAULTS = {
-            "Strip[3].Gain": 0.0, "Bus[3].Gain": 0.0, "Bus[4].Gain": 0.0,
-            "Strip[0].Gain": 0.0,
-            "Strip[3].eqgain1": 0.0, "Strip[3].eqgain2": 0.0,
-            "Strip[3].eqgain3": 0.0,
-        }
         vm_state_path = SCRIPT_DIR / "vm_state.json"
-        vm_params = dict(VM_DEFAULTS)
+        vm_params = VM_DEFAULTS
         if vm_state_path.exists():
             try:
                 with open(vm_state_path) as f:
@@ -531,21 +897,17 @@ class VRAudioSwitcher:
             except Exception:
                 logging.exception("Failed to read vm_state.json, using defaults")
 
-        vm_params["Strip[0].B1"] = 1.0
-        vm_params["Strip[3].B2"] = 1.0
-        vm_params["Strip[0].A1"] = 0.0
-        vm_params["Strip[3].A1"] = 0.0
-
-        for param, value in vm_params.items():
-            try:
-                self.vm.set_param(param, float(value))
-            except (ValueError, TypeError):
-                logging.warning("Skipping invalid VM param %s=%s", param, value)
-        time.sleep(0.5)
-        self.vm.set_param("Strip[0].B1", 1.0)
-        self.vm.set_param("Strip[3].B2", 1.0)
+        # Routing flags always win over saved values
+        valid = _float_params(vm_params)
+        valid.update(VM_ROUTING)
+        # One DLL round-trip for the lot; per-param writes if it's rejected
+        if not self.vm.set_params_bulk(valid):
+            for param, value in valid.items():
+                self.vm.set_param(param, value)
+        # No settle-and-reassert of B1/B2 here: they're in VM_ROUTING
+        # above, and every enforce pass re-asserts them anyway
         logging.info("Applied %d VM params (routing + %s)",
-                     len(vm_params),
+                     len(valid),
                      "saved" if vm_state_path.exists() else "defaults")
         self._vm_ready.set()
 
@@ -570,15 +932,26 @@ class VRAudioSwitcher:
 
             need_switch = force or desired != self._current_output or not self._confirmed
             if need_switch:
-                ok = self.audio.switch_to(desired)
-                if ok:
-                    changed = desired != self._current_output
-                    self._current_output = desired
-                    self._confirmed = True
-                    if changed:
-                        logging.info("Audio -> %s", desired.name)
-                else:
-                    self._confirmed = False
+                full_pass = self._enforce_tick % ENFORCE_FULL_EVERY == 0
+                # Routine enforce passes may reuse the last enumeration
+                targets = self.audio.audio_targets(
+                    fresh=not force or full_pass or not self._confirmed)
+                # Enforce pass with the same output and the same apps as
+                # last time: nothing to re-route, bar a periodic full pass
+                steady = (force and self._confirmed and not full_pass
+                          and (desired, targets) == self._last_applied)
+                if not steady:
+                    ok = self.audio.switch_to(desired, targets)
+                    if ok:
+                        changed = desired != self._current_output
+                        self._current_output = desired
+                        self._confirmed = True
+                        self._last_applied = (desired, targets)
+                        if changed:
+                            logging.info("Audio -> %s", desired.name)
+                    else:
+                        self._confirmed = False
+                        self._last_applied = None
 
             # Sync music-to-mic routing (Strip[3].B1)
             if desired_mic != self._mic_enabled or force:
@@ -596,6 +969,25 @@ class VRAudioSwitcher:
             # Notify UI to refresh mode display
             self._notify_ui()
 
+    def request_apply(self):
+        """Queue a debounced _apply(); bursts of requests run it once."""
+        self._apply_pending.set()
+        if self._apply_thread is None:
+            self._apply_thread = threading.Thread(
+                target=self._apply_worker, daemon=True)
+            self._apply_thread.start()
+
+    def _apply_worker(self):
+        while True:
+            self._apply_pending.wait()
+            time.sleep(APPLY_DEBOUNCE)
+            # Clear before applying so a request made mid-apply runs again
+            self._apply_pending.clear()
+            try:
+                self._apply()
+            except Exception:
+                logging.exception("Apply error")
+
     def _notify_ui(self):
         """Thread-safe UI notification to refresh mode/VR display."""
         if self.ui and self.ui.root:
@@ -607,38 +999,53 @@ class VRAudioSwitcher:
     def _reload_config_if_changed(self):
         """Re-read config.json to pick up Settings tab changes."""
         try:
-            if CONFIG_PATH.exists():
-                with open(CONFIG_PATH) as f:
-                    fresh = json.load(f)
-                if self.audio._multi_target:
-                    new_exclude = fresh.get("exclude_processes", [])
-                    self.audio._user_exclude = {p.lower() for p in new_exclude}
+            # Only re-parse when the Settings tab (or the user) saved it
+            mtime = CONFIG_PATH.stat().st_mtime_ns
+            if mtime == self._config_mtime:
+                return
+            with open(CONFIG_PATH) as f:
+                fresh = json.load(f)
+            self._config_mtime = mtime
+            if self.audio._multi_target:
+                self.audio.user_exclude = fresh.get(
+                    "exclude_processes", [])
         except Exception:
             pass
 
     def _enforce_loop(self):
         """Periodically re-apply audio and monitor VoiceMeeter health."""
+        # Fixed cadence: wake on absolute deadlines so work time doesn't
+        # stretch the interval. After an overrun, skip the missed ticks
+        deadline = time.monotonic()
         while not self._stop.is_set():
-            self._stop.wait(ENFORCE_INTERVAL)
-            if self._stop.is_set():
+            now = time.monotonic()
+            deadline += ENFORCE_INTERVAL
+            if deadline < now:
+                deadline += (now - deadline) // ENFORCE_INTERVAL \
+                    * ENFORCE_INTERVAL + ENFORCE_INTERVAL
+            if self._stop.wait(deadline - now):
                 break
+            self._enforce_tick += 1
             try:
+                # One process walk per cycle; everything below reads from it
+                names = _snapshot_proc_names()
                 self._reload_config_if_changed()
                 self._apply(force=True)
-                self._check_voicemeeter_health()
+                self._check_voicemeeter_health(names)
             except Exception:
                 logging.exception("Enforce error")
+            # Buffered INFO lines would die with a crash or a hard kill
+            if self._enforce_tick % LOG_FLUSH_EVERY == 0:
+                _flush_logs()
 
-    def _check_voicemeeter_health(self):
+    def _check_voicemeeter_health(self, names: frozenset[str] | None = None):
         """Detect if VoiceMeeter closed during session and prompt user."""
         if not self._session_active or self._vm_dialog_shown:
             return
-        from vm_path import is_vm_process
-        vm_running = any(
-            is_vm_process(p.info.get("name", ""))
-            for p in psutil.process_iter(["name"])
-        )
-        if vm_running:
+        if names is None:
+            names = _snapshot_proc_names()
+        # names is already lowercased: four hash probes, not one per process
+        if not names.isdisjoint(VM_PROCESS_NAMES):
             return
         logging.warning("VoiceMeeter stopped during active session")
         self._vm_dialog_shown = True
@@ -650,7 +1057,6 @@ class VRAudioSwitcher:
 
     def restart_voicemeeter(self):
         """Restart VoiceMeeter and restore all settings."""
-        from vm_path import find_exe
         vm_exe = find_exe()
         if not vm_exe:
             logging.error("Cannot restart VoiceMeeter — exe not found")
@@ -662,21 +1068,23 @@ class VRAudioSwitcher:
         si = subprocess.STARTUPINFO()
         si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         si.wShowWindow = 7  # SW_SHOWMINNOACTIVE
-        subprocess.Popen([str(vm_exe)], startupinfo=si)
-        time.sleep(6)  # VM needs time to fully init its API
+        self._vm_proc = subprocess.Popen([str(vm_exe)], startupinfo=si)
+        _record_vm_pid(self._vm_proc.pid, vm_exe)
+        # Wait for the engine to answer the API (it used to be a flat 6s
+        # sleep plus up to 5 login retries)
+        if not _wait_until(self.vm.is_running, 11, interval=0.1):
+            logging.warning("VoiceMeeter API not ready after restart")
         self._minimize_voicemeeter()
-        # Retry login a few times — VM API may not be ready immediately
-        for attempt in range(5):
-            if self.vm._ensure_connected():
-                break
-            time.sleep(1)
         # Restore devices
         if VM_DEVICES_PATH.exists():
             try:
                 with open(VM_DEVICES_PATH) as f:
-                    devs = json.load(f)
-                for key, name in devs.items():
-                    self.vm.set_string_param(f"{key}.device.wdm", name)
+                    devs = {f"{key}.device.wdm": name
+                            for key, name in json.load(f).items()}
+                # One SetParameters script; one call per device if rejected
+                if not self.vm.set_params_bulk(devs):
+                    for param, name in devs.items():
+                        self.vm.set_string_param(param, name)
             except Exception:
                 logging.exception("Device restore after VM restart failed")
         # Restore gains
@@ -684,9 +1092,10 @@ class VRAudioSwitcher:
         if vm_state_path.exists():
             try:
                 with open(vm_state_path) as f:
-                    params = json.load(f)
-                for k, v in params.items():
-                    self.vm.set_param(k, float(v))
+                    params = _float_params(json.load(f))
+                if not self.vm.set_params_bulk(params):
+                    for k, v in params.items():
+                        self.vm.set_param(k, v)
             except Exception:
                 logging.exception("Gain restore after VM restart failed")
         self._vm_dialog_shown = False
@@ -699,6 +1108,7 @@ class VRAudioSwitcher:
         if running and not self._session_active:
             logging.info("VR detected — signaling session start")
             self._vr_start_event.set()
+            self._wake.set()
         elif not running and self._session_active:
             logging.info("VR stopped — closing session")
             if self.ui and self.ui.root:
@@ -710,17 +1120,22 @@ class VRAudioSwitcher:
     def _write_state(self):
         """Write current mode to state.json for persistence."""
         try:
-            state = {}
-            if STATE_PATH.exists():
-                try:
-                    with open(STATE_PATH) as f:
-                        state = json.load(f)
-                except Exception:
-                    pass
-            state["current_mode"] = self._user_mode.name
-            state["vr_active"] = self.detector.is_vr_running()
-            with open(STATE_PATH, "w") as f:
-                json.dump(state, f)
+            state = self._state_cache
+            if state is None:
+                # First write: keep any other keys already on disk
+                state = {}
+                if STATE_PATH.exists():
+                    try:
+                        with open(STATE_PATH) as f:
+                            state = json.load(f)
+                    except Exception:
+                        pass
+            fresh = dict(state, current_mode=self._user_mode.name,
+                         vr_active=self.detector.is_vr_running(cached=True))
+            if fresh == self._state_cache:
+                return
+            write_json(STATE_PATH, fresh)
+            self._state_cache = fresh
         except Exception:
             logging.exception("Failed to write state file")
 
@@ -735,7 +1150,13 @@ class VRAudioSwitcher:
             logging.info("User mode -> %s", mode_name)
             self._write_state()
             self._notify_ui()  # instant visual feedback before svcl runs
-            threading.Thread(target=self._apply, daemon=True).start()
+            self.request_apply()
+
+    def note_update_available(self, local: str, remote: str):
+        """Late boot update check found a release; offered in Settings."""
+        logging.info("Update available: v%s -> v%s (found after boot)",
+                     local, remote)
+        self.pending_update = remote
 
     def get_mode_name(self) -> str:
         return self._user_mode.name
@@ -804,19 +1225,44 @@ class VRAudioSwitcher:
                 win.destroy()
                 return
             # Consume any duplicate signals while window is open
-            if SHOW_UI_SIGNAL.exists():
-                try:
-                    SHOW_UI_SIGNAL.unlink(missing_ok=True)
-                except OSError:
-                    pass
+            self._take_show_ui_request()
             win.after(500, _poll)
 
         win.after(500, _poll)
         win.mainloop()
 
+    def _take_show_ui_request(self) -> bool:
+        """Consume a pending "show UI" request (event or fallback file)."""
+        requested = self._show_ui_requested.is_set()
+        self._show_ui_requested.clear()
+        if SHOW_UI_SIGNAL.exists():
+            requested = True
+            try:
+                SHOW_UI_SIGNAL.unlink(missing_ok=True)
+            except OSError:
+                pass
+        return requested
+
+    def _show_ui_listener(self):
+        """Wait on the named show-UI event a second launch signals."""
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        handle = kernel32.CreateEventW(None, False, False, SHOW_UI_EVENT)
+        if not handle:
+            return  # run() still polls the fallback file
+        handle = wintypes.HANDLE(handle)
+        try:
+            while not self._user_quit:
+                if kernel32.WaitForSingleObject(handle, 1000) == 0:
+                    self._show_ui_requested.set()
+                    self._wake.set()
+        finally:
+            kernel32.CloseHandle(handle)
+
     def run(self):
         """Main loop: watch for SteamVR, run sessions, repeat."""
         self.detector.start()
+        threading.Thread(target=self._show_ui_listener, daemon=True).start()
 
         while not self._user_quit:
             logging.info("Waiting for SteamVR...")
@@ -828,14 +1274,14 @@ class VRAudioSwitcher:
 
             # Block until VR starts (or app quits)
             while not self._user_quit and not self._vr_start_event.is_set():
+                self._wake.clear()
                 # Check for "show UI" signal from desktop shortcut click
-                if SHOW_UI_SIGNAL.exists():
-                    try:
-                        SHOW_UI_SIGNAL.unlink(missing_ok=True)
-                    except OSError:
-                        pass
+                if self._take_show_ui_request():
                     self._show_waiting_window()
-                self._vr_start_event.wait(timeout=5)
+                    continue
+                # The timeout only matters for the fallback signal file
+                self._wake.wait(timeout=5)
+                _flush_logs()
 
             if self._user_quit:
                 break
@@ -847,6 +1293,7 @@ class VRAudioSwitcher:
 
             logging.info("SteamVR detected — starting session")
             self._start_vr_session()
+            _flush_logs()
             self.ui.run()  # tkinter mainloop blocks until window closes
             self._end_vr_session()
 
@@ -854,6 +1301,7 @@ class VRAudioSwitcher:
             time.sleep(5)
 
         self.detector.stop()
+        self.audio.close()
 
     def _start_vr_session(self):
         """Boot VoiceMeeter, init audio, open UI."""
@@ -878,20 +1326,23 @@ class VRAudioSwitcher:
 
         # Launch VoiceMeeter if not already running
         _splash_update("Starting VoiceMeeter...")
-        from vm_path import is_vm_process, find_exe
-        vm_running = any(
-            is_vm_process(p.info.get("name", ""))
-            for p in psutil.process_iter(["name"])
-        )
+        # Warm start: the PID we recorded last time is usually still it
+        vm_pid = _recorded_vm_pid()
+        if not vm_pid:
+            vm_pid = _vm_pid()
+            if vm_pid:
+                _record_vm_pid(vm_pid)
         vm_just_launched = False
-        if not vm_running:
+        if not vm_pid:
             vm_exe = find_exe()
             if vm_exe:
                 logging.info("Launching VoiceMeeter (%s)...", vm_exe.name)
                 si = subprocess.STARTUPINFO()
                 si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 si.wShowWindow = 7  # SW_SHOWMINNOACTIVE
-                subprocess.Popen([str(vm_exe)], startupinfo=si)
+                self._vm_proc = subprocess.Popen([str(vm_exe)],
+                                                 startupinfo=si)
+                _record_vm_pid(self._vm_proc.pid, vm_exe)
                 vm_just_launched = True
             else:
                 logging.warning("VoiceMeeter not found — install it first")
@@ -899,7 +1350,9 @@ class VRAudioSwitcher:
         # Initialize VoiceMeeter API
         _splash_update("Initializing audio...")
         if vm_just_launched:
-            time.sleep(4)
+            # Proceed as soon as the engine answers instead of a fixed 4s
+            if not _wait_until(self.vm.is_running, 10, interval=0.1):
+                logging.warning("VoiceMeeter API not ready after 10s")
             self._minimize_voicemeeter()
         self._init_voicemeeter()
         self._apply()
@@ -912,8 +1365,8 @@ class VRAudioSwitcher:
         if first_launch:
             self.config["first_launch_done"] = True
             try:
-                with open(CONFIG_PATH, "w") as f:
-                    json.dump(self.config, f, indent=2)
+                # config.json is user-editable; keep it readable
+                write_json(CONFIG_PATH, self.config, indent=2)
             except Exception:
                 pass
 
@@ -992,25 +1445,23 @@ class VRAudioSwitcher:
         _splash_update("Saving settings...")
         def _save_and_shutdown():
             try:
-                devices = {}
-                for i in range(3):  # Hardware strips 0-2
-                    name = self.vm.get_string_param(f"Strip[{i}].device.name")
-                    if name:
-                        devices[f"Strip[{i}]"] = name
-                for i in range(3):  # Hardware buses A1-A3
-                    name = self.vm.get_string_param(f"Bus[{i}].device.name")
-                    if name:
-                        devices[f"Bus[{i}]"] = name
+                # Hardware strips 0-2 and buses A1-A3
+                keys = ([f"Strip[{i}]" for i in range(3)]
+                        + [f"Bus[{i}]" for i in range(3)])
+                names = self.vm.get_string_params(
+                    [f"{k}.device.name" for k in keys])
+                devices = {k: names[f"{k}.device.name"] for k in keys
+                           if f"{k}.device.name" in names}
                 if devices:
-                    with open(VM_DEVICES_PATH, "w") as f:
-                        json.dump(devices, f, indent=2)
+                    write_json(VM_DEVICES_PATH, devices, indent=2)
                     logging.info("Saved %d device assignments", len(devices))
             except Exception:
                 logging.exception("Failed to save device config")
 
             _splash_update("Closing VoiceMeeter...")
             self.vm.shutdown()
-            time.sleep(2)
+            # Give it up to 2s to save and exit, but no longer than needed
+            _wait_until(lambda: _vm_pid() == 0, 2, interval=0.1)
             self.vm.close()
             self.vm._logged_in = False
 
@@ -1023,23 +1474,25 @@ class VRAudioSwitcher:
 
         # Force-kill VoiceMeeter if it's still running
         _splash_update("Verifying VoiceMeeter stopped...")
-        from vm_path import is_vm_process
+        proc, self._vm_proc = self._vm_proc, None
+        if proc is not None:
+            # We launched it, so wait on our own handle instead of scanning
+            try:
+                proc.wait(timeout=4)
+            except subprocess.TimeoutExpired:
+                logging.warning("VoiceMeeter still running after 4s, force-killing...")
+                proc.kill()
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    pass
         for i in range(8):
-            vm_alive = any(
-                is_vm_process(p.info.get("name", ""))
-                for p in psutil.process_iter(["name"])
-            )
-            if not vm_alive:
+            if _vm_pid() == 0:
                 logging.info("VoiceMeeter stopped after %ds", i)
                 break
             if i == 4:
                 logging.warning("VoiceMeeter still running after 4s, force-killing...")
-                for proc in psutil.process_iter(["name", "pid"]):
-                    try:
-                        if is_vm_process(proc.info.get("name", "")):
-                            proc.kill()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                kill_vm_processes()
             time.sleep(1)
 
         # Wait for SteamVR to fully stop (in case close_steamvr was called)
@@ -1070,6 +1523,7 @@ class VRAudioSwitcher:
         self._in_cleanup = False
         self.detector._vr_running = None  # reset for next detection cycle
         logging.info("VR session ended — back to watching")
+        _flush_logs()
 
 
 # ---------------------------------------------------------------------------
@@ -1080,14 +1534,21 @@ def main():
     if mutex is None:
         # Signal the running instance to show its window
         try:
-            SHOW_UI_SIGNAL.touch()
-        except OSError:
+            signal_show_ui()
+        except Exception:
             pass
         sys.exit(0)
 
+    # Start the update check's network round-trip now so it overlaps
+    # config loading, splash start-up and logging setup
+    try:
+        from updater import prefetch_remote_version
+        prefetch_remote_version()
+    except Exception:
+        pass
+
     def _show_error_and_exit(msg):
-        ctypes.windll.user32.MessageBoxW(
-            0, msg, "VR Audio Switcher", 0x10)  # MB_ICONERROR
+        _msgbox(msg, error=True)
         sys.exit(1)
 
     if not CONFIG_PATH.exists():
@@ -1096,8 +1557,14 @@ def main():
             "Please run the setup wizard first:\n"
             "Double-click install.bat or run setup_wizard.py")
 
-    with open(CONFIG_PATH) as f:
-        config = json.load(f)
+    try:
+        with open(CONFIG_PATH) as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        _show_error_and_exit(
+            "config.json couldn't be read.\n\n"
+            "Please run the setup wizard again:\n"
+            "Double-click install.bat or run setup_wizard.py")
 
     if not config.get("vr_device"):
         _show_error_and_exit(
@@ -1116,21 +1583,33 @@ def main():
         except Exception:
             pass
 
-    # Rotate log at 1 MB, keep 1 backup
+    # Rotate log at 5 MB, keep 1 backup. Records are buffered and written
+    # in batches; warnings and errors flush straight through
+    log_format = "%(asctime)s [%(levelname)s] %(message)s"
     file_handler = logging.handlers.RotatingFileHandler(
-        LOG_PATH, maxBytes=1_000_000, backupCount=1,
+        LOG_PATH, maxBytes=5_000_000, backupCount=1,
+    )
+    # MemoryHandler hands records to the target unformatted, so the file
+    # handler needs its own formatter (basicConfig only sets buffered's)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered = logging.handlers.MemoryHandler(
+        256, flushLevel=logging.WARNING, target=file_handler,
     )
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[file_handler, logging.StreamHandler()],
+        format=log_format,
+        handlers=[buffered, logging.StreamHandler()],
     )
 
-    # Forced auto-update on boot
+    # Forced auto-update on boot. Only wait a little for the network: a
+    # check that hasn't answered by then finishes in the background
     _splash_update("Checking for updates...")
+    update_pending = False
     try:
-        from updater import update_available, do_update, restart_app
-        avail, local_ver, remote_ver = update_available()
+        from updater import (update_available, do_update, restart_app,
+                             remote_check_pending)
+        avail, local_ver, remote_ver = update_available(BOOT_UPDATE_WAIT)
+        update_pending = remote_check_pending()
         if avail:
             _splash_update(f"Downloading update v{remote_ver}...")
             logging.info("Update available: v%s -> v%s, auto-updating...",
@@ -1161,6 +1640,10 @@ def main():
 
     logging.info("VR Audio Switcher starting (watching for SteamVR)...")
     app = VRAudioSwitcher(config)
+    if update_pending:
+        logging.info("Update check still running, continuing boot")
+        from updater import check_in_background
+        check_in_background(app.note_update_available)
     app.run()
 
 
@@ -0,0 +1,123 @@
+"""Process name lookups straight from a Toolhelp32 snapshot.
+
+Cheaper than psutil.process_iter() when all we need is exe names: one
+kernel snapshot, no per-PID OpenProcess and no psutil.Process objects.
+Every function returns None if the snapshot can't be taken, so callers
+can fall back to psutil.
+"""
+
+import ctypes
+import ctypes.wintypes as wintypes
+
+TH32CS_SNAPPROCESS = 0x2
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+_INVALID_HANDLE = ctypes.c_void_p(-1).value
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260),
+    ]
+
+
+_kernel32 = None
+
+
+def _k32():
+    """kernel32 with the Toolhelp prototypes declared (once)."""
+    global _kernel32
+    if _kernel32 is None:
+        k = ctypes.WinDLL("kernel32", use_last_error=True)
+        k.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD,
+                                               wintypes.DWORD]
+        k.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        entry_p = ctypes.POINTER(_PROCESSENTRY32W)
+        for fn in (k.Process32FirstW, k.Process32NextW):
+            fn.argtypes = [wintypes.HANDLE, entry_p]
+            fn.restype = wintypes.BOOL
+        k.CloseHandle.argtypes = [wintypes.HANDLE]
+        k.CloseHandle.restype = wintypes.BOOL
+        k.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL,
+                                  wintypes.DWORD]
+        k.OpenProcess.restype = wintypes.HANDLE
+        k.GetExitCodeProcess.argtypes = [wintypes.HANDLE,
+                                         ctypes.POINTER(wintypes.DWORD)]
+        k.GetExitCodeProcess.restype = wintypes.BOOL
+        _kernel32 = k
+    return _kernel32
+
+
+def _walk():
+    """Yield (pid, exe name) for every process in a fresh snapshot.
+
+    Raises OSError if the snapshot can't be taken.
+    """
+    k = _k32()
+    snap = k.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snap or snap == _INVALID_HANDLE:
+        raise OSError("CreateToolhelp32Snapshot failed")
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        ok = k.Process32FirstW(snap, ctypes.byref(entry))
+        while ok:
+            yield entry.th32ProcessID, entry.szExeFile
+            ok = k.Process32NextW(snap, ctypes.byref(entry))
+    finally:
+        k.CloseHandle(snap)
+
+
+def enum_names() -> frozenset[str] | None:
+    """Lowercased exe names of all running processes."""
+    try:
+        return frozenset(name.lower() for _, name in _walk())
+    except OSError:
+        return None
+
+
+def find_pid(match) -> int | None:
+    """PID of the first process whose exe name satisfies match(name).
+
+    0 if none does; None if the snapshot failed.
+    """
+    try:
+        return next((pid for pid, n in _walk() if match(n)), 0)
+    except OSError:
+        return None
+
+
+def open_process(pid: int) -> int:
+    """Query handle for pid, or 0. Holding it stops the PID being reused."""
+    try:
+        return _k32().OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION,
+                                  False, pid) or 0
+    except OSError:
+        return 0
+
+
+def handle_alive(handle: int) -> bool:
+    """True while the process behind an open_process() handle runs."""
+    code = wintypes.DWORD()
+    try:
+        if not _k32().GetExitCodeProcess(handle, ctypes.byref(code)):
+            return False
+    except OSError:
+        return False
+    return code.value == STILL_ACTIVE
+
+
+def close_handle(handle: int):
+    try:
+        _k32().CloseHandle(handle)
+    except OSError:
+        pass